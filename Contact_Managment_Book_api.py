@@ -0,0 +1,354 @@
+import argparse
+import asyncio
+import json
+import re
+import sys
+import traceback
+from contextlib import redirect_stdout
+from http import HTTPStatus
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from Contact_Managment_Book_batch import execute
+from Contact_Managment_Book_core import AddressBook, Find, Record
+from Contact_Managment_Book_daemon import BookServer
+from Contact_Managment_Book_memstats import memory_report
+from Contact_Managment_Book_v2 import registry
+from Contact_Managment_Book_validation import validate_contacts
+
+MAX_BODY = 16 * 1024 * 1024
+PAGE_LIMIT = 1000
+STREAM_CHUNK = 500
+
+FINDERS = {
+    "name": Find.find_by_name,
+    "phone": Find.find_by_phone,
+    "birthday": Find.find_by_birthday,
+    "address": Find.find_by_address,
+    "email": Find.find_by_email,
+}
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class Request:
+    def __init__(self, method, target, version, headers, body):
+        self.method = method
+        self.version = version
+        self.headers = headers
+        self.body = body
+        parts = urlsplit(target)
+        self.path = parts.path
+        self.query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+
+    @property
+    def keep_alive(self):
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+    def json(self):
+        try:
+            return json.loads(self.body or b"null")
+        except ValueError as e:
+            raise HttpError(400, f"Неправильний JSON: {e}")
+
+    def int_param(self, name, default, maximum=None):
+        try:
+            value = int(self.query.get(name, default))
+        except ValueError:
+            raise HttpError(400, f"Параметр {name} має бути числом.")
+        if value < 0:
+            raise HttpError(400, f"Параметр {name} не може бути від'ємним.")
+        return min(value, maximum) if maximum is not None else value
+
+
+class Stream:
+    # Відповідь, що віддається частинами (chunked), щоб не збирати весь список у пам'яті
+    def __init__(self, chunks, content_type="application/x-ndjson"):
+        self.chunks = chunks
+        self.content_type = content_type
+
+
+async def read_request(reader):
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, version = line.decode("latin-1").split()
+    except ValueError:
+        raise HttpError(400, "Неправильний рядок запиту.")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HttpError(400, "Неправильний Content-Length.")
+    if length > MAX_BODY:
+        raise HttpError(413, "Тіло запиту завелике.")
+    body = await reader.readexactly(length) if length else b""
+    return Request(method.upper(), target, version, headers, body)
+
+
+def encode_head(status, headers):
+    lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+    lines += [f"{name}: {value}" for name, value in headers]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+def encode_response(status, payload, keep_alive):
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    headers = [
+        ("Content-Type", "application/json; charset=utf-8"),
+        ("Content-Length", len(body)),
+        ("Connection", "keep-alive" if keep_alive else "close"),
+    ]
+    return encode_head(status, headers) + body
+
+
+def record_from_json(data, name=None):
+    # Тіло запиту має той самий формат, що й записи у файлі книги, і проходить ту саму перевірку
+    if not isinstance(data, dict):
+        raise HttpError(400, "Очікується об'єкт JSON із полями контакту.")
+    if name is not None:
+        data = dict(data, name=data.get("name") or name)
+    report = validate_contacts([data])
+    if report.errors or not report.rows:
+        raise HttpError(422, [issue._asdict() for issue in report.errors])
+    return Record.from_valid(report.rows[0])
+
+
+class ApiServer(BookServer):
+    def __init__(self, book, registry, host="127.0.0.1", port=8080, autosave=5.0):
+        super().__init__(book, registry, path=None, autosave=autosave)
+        self.host = host
+        self.port = port
+        self.routes = [
+            ("GET", re.compile(r"/health"), self.health),
+            ("GET", re.compile(r"/contacts"), self.list_contacts),
+            ("GET", re.compile(r"/contacts\.ndjson"), self.stream_contacts),
+            ("POST", re.compile(r"/contacts"), self.create_contact),
+            ("GET", re.compile(r"/contacts/(?P<name>[^/]+)"), self.get_contact),
+            ("PUT", re.compile(r"/contacts/(?P<name>[^/]+)"), self.replace_contact),
+            ("DELETE", re.compile(r"/contacts/(?P<name>[^/]+)"), self.delete_contact),
+            ("GET", re.compile(r"/find/(?P<field>\w+)"), self.find),
+            ("GET", re.compile(r"/hashtags/(?P<hashtag>[^/]+)"), self.find_hashtag),
+            ("GET", re.compile(r"/search"), self.search),
+            ("GET", re.compile(r"/birthdays"), self.birthdays),
+            ("GET", re.compile(r"/memstats"), self.memstats),
+            ("POST", re.compile(r"/commands/(?P<command>[^/]+)"), self.run_command),
+            ("POST", re.compile(r"/save"), self.save_book),
+        ]
+
+    async def start_server(self):
+        server = await asyncio.start_server(self.handle, self.host, self.port)
+        # Порт 0 означає вільний порт, обраний системою
+        self.port = server.sockets[0].getsockname()[1]
+        print(f"API слухає http://{self.host}:{self.port}", file=sys.stderr, flush=True)
+        return server
+
+    def cleanup(self):
+        pass
+
+    async def handle(self, reader, writer):
+        self.clients += 1
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except HttpError as e:
+                    writer.write(encode_response(e.status, {"error": str(e)}, False))
+                    break
+                if request is None:
+                    break
+                keep_alive = request.keep_alive and not self.stopping.is_set()
+                try:
+                    status, payload = self.dispatch(request)
+                except HttpError as e:
+                    status, payload = e.status, {"error": e.args[0]}
+                except Exception:
+                    # Помилка в обробнику не обриває з'єднання: клієнт отримує відповідь, а з'єднання лишається придатним
+                    traceback.print_exc(file=sys.stderr)
+                    status, payload = 500, {"error": "Внутрішня помилка сервера."}
+                if isinstance(payload, Stream):
+                    await self.write_stream(writer, status, payload, keep_alive)
+                else:
+                    writer.write(encode_response(status, payload, keep_alive))
+                    await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError, BrokenPipeError):
+            pass
+        finally:
+            self.clients -= 1
+            writer.close()
+
+    async def write_stream(self, writer, status, stream, keep_alive):
+        headers = [
+            ("Content-Type", f"{stream.content_type}; charset=utf-8"),
+            ("Transfer-Encoding", "chunked"),
+            ("Connection", "keep-alive" if keep_alive else "close"),
+        ]
+        writer.write(encode_head(status, headers))
+        for chunk in stream.chunks:
+            data = chunk.encode("utf-8")
+            writer.write(f"{len(data):x}\r\n".encode("latin-1") + data + b"\r\n")
+            # drain() віддає керування іншим клієнтам між частинами довгого списку
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    def dispatch(self, request):
+        self.requests += 1
+        allowed = False
+        for method, pattern, handler in self.routes:
+            match = pattern.fullmatch(request.path)
+            if match is None:
+                continue
+            if method != request.method:
+                allowed = True
+                continue
+            params = {key: unquote(value) for key, value in match.groupdict().items()}
+            return handler(request, **params)
+        if allowed:
+            raise HttpError(405, "Метод не підтримується.")
+        raise HttpError(404, "Не знайдено.")
+
+    def record_or_404(self, name):
+        record = self.book.find(name)
+        if record is None:
+            raise HttpError(404, f"Контакт {name} не знайдено.")
+        return record
+
+    def health(self, request):
+        return 200, {"ok": True, "records": len(self.book), "requests": self.requests, "clients": self.clients}
+
+    def list_contacts(self, request):
+        offset = request.int_param("offset", 0)
+        limit = request.int_param("limit", 50, PAGE_LIMIT)
+        if request.query.get("format") == "ndjson":
+            return self.stream_contacts(request)
+        # Сторінки беруться з відсортованого індексу імен, тож порядок стабільний між запитами
+        keys = self.book.names.page(offset, limit)
+        total = len(self.book.names)
+        next_offset = offset + len(keys) if offset + len(keys) < total else None
+        items = [self.book.data[key].to_dict() for key in keys if key in self.book.data]
+        return 200, {"items": items, "total": total, "offset": offset, "limit": limit, "next_offset": next_offset}
+
+    def stream_contacts(self, request):
+        keys = list(self.book.names)
+        data = self.book.data
+
+        def chunks():
+            for start in range(0, len(keys), STREAM_CHUNK):
+                lines = [json.dumps(data[key].to_dict(), ensure_ascii=False) for key in keys[start:start + STREAM_CHUNK] if key in data]
+                if lines:
+                    yield "\n".join(lines) + "\n"
+
+        return 200, Stream(chunks())
+
+    def get_contact(self, request, name):
+        return 200, self.record_or_404(name).to_dict()
+
+    def create_contact(self, request):
+        record = record_from_json(request.json())
+        if self.book.find(record.name.value) is not None:
+            raise HttpError(409, f"Контакт {record.name.value} вже існує.")
+        self.book.add_record(record)
+        self.dirty = True
+        return 201, record.to_dict()
+
+    def replace_contact(self, request, name):
+        old = self.record_or_404(name)
+        record = record_from_json(request.json(), name=old.original_name)
+        key = record.name.value.lower()
+        if key != name.lower():
+            if self.book.find(key) is not None:
+                raise HttpError(409, f"Контакт {record.name.value} вже існує.")
+            self.book.delete(name)
+        self.book.add_record(record)
+        self.dirty = True
+        return 200, record.to_dict()
+
+    def delete_contact(self, request, name):
+        self.record_or_404(name)
+        self.book.delete(name)
+        self.dirty = True
+        return 200, {"ok": True, "deleted": name}
+
+    def find(self, request, field):
+        finder = FINDERS.get(field)
+        if finder is None:
+            raise HttpError(404, f"Пошук за полем {field} не підтримується. Доступні: {', '.join(FINDERS)}.")
+        value = request.query.get("q")
+        if not value:
+            raise HttpError(400, "Вкажіть значення для пошуку в параметрі q.")
+        return 200, {"items": [record.to_dict() for record in finder(self.book, value)]}
+
+    def find_hashtag(self, request, hashtag):
+        hashtag = hashtag if hashtag.startswith("#") else f"#{hashtag}"
+        return 200, {"items": [record.to_dict() for record in self.book.find_by_notion_or_hashtag(hashtag)]}
+
+    def search(self, request):
+        limit = request.int_param("limit", 50, PAGE_LIMIT)
+        records = self.book.search(request.query.get("q", ""), limit)
+        return 200, {"items": [record.to_dict() for record in records]}
+
+    def birthdays(self, request):
+        days = request.int_param("days", 7, 366)
+        upcoming = self.book.upcoming_birthdays(days)
+        return 200, {"items": [dict(record.to_dict(), next_birthday=date.strftime('%d.%m.%Y')) for date, record in upcoming]}
+
+    def memstats(self, request):
+        return 200, memory_report(self.book, top=request.int_param("top", 10, 100))
+
+    def run_command(self, request, command):
+        # Той самий реєстр команд, що й у консолі; аргументи передаються списком "args"
+        body = request.json() or {}
+        args = body.get("args", []) if isinstance(body, dict) else []
+        if not isinstance(args, list):
+            raise HttpError(400, "Поле args має бути списком рядків.")
+        result = execute(self.session, command, [str(arg) for arg in args])
+        definition = self.registry.commands.get(result["command"])
+        if result["ok"] and definition is not None and definition.mutates:
+            self.dirty = True
+        return (200 if result["ok"] else 400), result
+
+    def save_book(self, request):
+        self.save()
+        return 200, {"ok": True, "saved": self.book.filename}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="HTTP/JSON API книги контактів")
+    parser.add_argument("--file", default="contacts_book.json", help="файл книги контактів")
+    parser.add_argument("--host", default="127.0.0.1", help="адреса для прослуховування")
+    parser.add_argument("--port", type=int, default=8080, help="порт (0 - будь-який вільний)")
+    parser.add_argument("--autosave", type=float, default=5.0, help="інтервал збереження змін у секундах (0 - лише при зупинці)")
+    return parser
+
+
+def main(argv=None):
+    options = build_parser().parse_args(argv)
+    with redirect_stdout(sys.stderr):
+        book = AddressBook(options.file, thread_safe=True)
+    book.search_index()
+    server = ApiServer(book, registry, options.host, options.port, options.autosave)
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+import io
+import json
+import shlex
+import sys
+import threading
+from contextlib import contextmanager, redirect_stdout
+
+from Contact_Managment_Book_commands import MissingArgument, Session
+
+
+class BatchSession(Session):
+    interactive = False
+
+    def __init__(self, book, registry=None):
+        super().__init__(book, registry)
+        self.output = []
+        self.printed = None
+
+    def ask(self, prompt):
+        if not self.args:
+            raise MissingArgument(prompt.strip())
+        return super().ask(prompt)
+
+    def say(self, *parts, sep=" ", end="\n", **kwargs):
+        # Те, що моделі надрукували до цього повідомлення, потрапляє у вивід раніше за нього
+        if self.printed is not None:
+            self.printed.flush()
+        text = sep.join(str(part) for part in parts).strip()
+        if text:
+            self.emit(text)
+
+    def emit(self, text):
+        self.output.append(text)
+
+
+class SessionOutput(io.TextIOBase):
+    # Друк моделей під час команди: збирається до наступного повідомлення сесії і йде у вивід перед ним
+    def __init__(self, session):
+        self.session = session
+        self.pending = []
+
+    def write(self, text):
+        self.pending.append(text)
+        return len(text)
+
+    def flush(self):
+        text = "".join(self.pending).strip()
+        self.pending = []
+        if text:
+            self.session.emit(text)
+
+    def writable(self):
+        return True
+
+
+class ThreadOutput(io.TextIOBase):
+    # Заміна sys.stdout, яка пише в потік, призначений поточному потоку виконання, а решту -
+    # у звичайний вивід. На відміну від redirect_stdout, команда у фоновому потоці не забирає собі
+    # друк інших потоків і не перебиває перенаправлення паралельної команди
+    def __init__(self, target):
+        self.target = target
+        self.local = threading.local()
+
+    def current(self):
+        return getattr(self.local, "stream", None) or self.target
+
+    def write(self, text):
+        return self.current().write(text)
+
+    def flush(self):
+        self.current().flush()
+
+    def writable(self):
+        return True
+
+    @property
+    def encoding(self):
+        return getattr(self.target, "encoding", "utf-8")
+
+
+_install_lock = threading.Lock()
+
+
+@contextmanager
+def capture_output(stream):
+    # Перехоплює друк лише поточного потоку
+    with _install_lock:
+        router = sys.stdout
+        if not isinstance(router, ThreadOutput):
+            router = sys.stdout = ThreadOutput(router)
+    previous = getattr(router.local, "stream", None)
+    router.local.stream = stream
+    try:
+        yield stream
+    finally:
+        router.local.stream = previous
+
+
+def parse_line(line):
+    # shlex потрібен лише для рядків з лапками, решта розбивається звичайним split
+    if '"' in line or "'" in line or "\\" in line:
+        return shlex.split(line)
+    return line.split()
+
+
+def execute_line(session, line):
+    words = parse_line(line)
+    return execute(session, words[0], words[1:])
+
+
+def execute(session, name, args):
+    command = session.registry.resolve(name)
+    if command is None:
+        return {"command": name, "ok": False, "error": "Неправильна команда."}
+
+    session.args = list(args)
+    session.output = []
+    # Повідомлення, які моделі друкують напряму, теж потрапляють у результат у тому ж порядку
+    printed = session.printed = SessionOutput(session)
+    try:
+        with capture_output(printed):
+            session.registry.dispatch(session, command.name)
+    except MissingArgument as e:
+        return {"command": command.name, "ok": False, "error": f"Бракує аргументу: {e}"}
+    except (OSError, ValueError, TypeError, KeyError, IndexError) as e:
+        return {"command": command.name, "ok": False, "error": str(e).strip()}
+    finally:
+        session.printed = None
+    printed.flush()
+    result = {"command": command.name, "ok": not session.failed, "output": session.output}
+    if session.data is not None:
+        result["data"] = session.data
+    if session.args:
+        result["unused_args"] = session.args
+    return result
+
+
+def run_batch(book, registry, lines, out=None, save=True):
+    out = out or sys.stdout
+    session = BatchSession(book, registry)
+    executed = failed = 0
+    dirty = False
+
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            result = execute_line(session, line)
+        except ValueError as e:
+            result = {"command": None, "ok": False, "error": f"Неможливо розібрати рядок: {e}"}
+        result["line"] = number
+        executed += 1
+        if result["ok"]:
+            command = registry.commands.get(result["command"])
+            dirty = dirty or (command is not None and command.mutates)
+        else:
+            failed += 1
+        out.write(json.dumps(result, ensure_ascii=False) + "\n")
+        if not session.running:
+            break
+
+    saved = None
+    if save and dirty:
+        with redirect_stdout(io.StringIO()):
+            book.save_to_json(book.filename)
+        saved = book.filename
+    summary = {"summary": {"executed": executed, "failed": failed, "saved": saved}}
+    out.write(json.dumps(summary, ensure_ascii=False) + "\n")
+    return failed
+
+
+def run_single(book, registry, name, args, out=None, save=True):
+    out = out or sys.stdout
+    session = BatchSession(book, registry)
+    result = execute(session, name, args)
+    command = registry.commands.get(result["command"])
+    if save and result["ok"] and command is not None and command.mutates:
+        with redirect_stdout(io.StringIO()):
+            book.save_to_json(book.filename)
+        result["saved"] = book.filename
+    out.write(json.dumps(result, ensure_ascii=False) + "\n")
+    return 0 if result["ok"] else 1
+
+
+def open_script(path):
+    if path == "-":
+        return sys.stdin
+    return open(path, "r", encoding="utf-8")
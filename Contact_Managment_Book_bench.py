@@ -0,0 +1,145 @@
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from Contact_Managment_Book_core import AddressBook, Find
+from Contact_Managment_Book_generator import write_contacts
+
+DEFAULT_SIZES = [1000, 10000]
+# Швидкі операції повторюються в циклі, поки один замір не триватиме хоча б стільки секунд,
+# інакше похибка таймера і шум планувальника перекривають сам результат
+MIN_SAMPLE_TIME = 0.01
+
+
+def measure(function, repeat):
+    # Друк операцій книги не повинен потрапляти ні в замір, ні в термінал
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        function()
+        first = time.perf_counter() - started
+        number = min(max(int(MIN_SAMPLE_TIME / first) if first else 1000, 1), 1000)
+        timings = [first] if number == 1 else []
+        while len(timings) < repeat:
+            started = time.perf_counter()
+            for _ in range(number):
+                function()
+            timings.append((time.perf_counter() - started) / number)
+    return timings
+
+
+def sample_queries(book):
+    # Запити беруться з середини згенерованих даних, тож кожен пошук справді щось знаходить
+    records = list(book.data.values())
+    middle = records[len(records) // 2:] + records[:len(records) // 2]
+    queries = {}
+    for record in middle:
+        queries.setdefault("name", record.name.value)
+        if record.phones:
+            queries.setdefault("phone", str(record.phones[0]))
+        if record.email:
+            queries.setdefault("email", record.email.value)
+        if record.birthday:
+            queries.setdefault("birthday", str(record.birthday))
+        if record.address and record.address.addresses:
+            queries.setdefault("address", record.address.addresses[0])
+        for notion in record.notions:
+            if notion.hashtags:
+                queries.setdefault("hashtag", notion.hashtags[0])
+        if len(queries) == 6:
+            break
+    return queries
+
+
+def operations(book, filename, saved):
+    queries = sample_queries(book)
+    # Індекс пошуку будується один раз заздалегідь, тож замір показує сам запит
+    book.search_index()
+    return [
+        ("load_from_json", lambda: AddressBook(filename)),
+        ("save_to_json", lambda: book.save_to_json(saved)),
+        ("find_by_name", lambda: Find.find_by_name(book, queries.get("name", ""))),
+        ("find_by_phone", lambda: Find.find_by_phone(book, queries.get("phone", ""))),
+        ("find_by_birthday", lambda: Find.find_by_birthday(book, queries.get("birthday", ""))),
+        ("find_by_address", lambda: Find.find_by_address(book, queries.get("address", ""))),
+        ("find_by_email", lambda: Find.find_by_email(book, queries.get("email", ""))),
+        ("find_by_notion_or_hashtag", lambda: book.find_by_notion_or_hashtag(queries.get("hashtag", ""))),
+        ("sort_by_hashtag", lambda: book.sort_by_hashtag(queries.get("hashtag", ""))),
+        ("search", lambda: book.search(queries.get("name", "").split()[-1][:4])),
+        ("all_names", book.all_names),
+        ("birthdays", book.birthdays),
+    ]
+
+
+def bench_size(size, seed, repeat, workdir, selected=None):
+    filename = os.path.join(workdir, f"contacts_{size}.json")
+    with open(filename, "w", encoding="utf-8") as out:
+        write_contacts(out, size, seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        book = AddressBook(filename)
+    results = []
+    for operation, function in operations(book, filename, os.path.join(workdir, f"saved_{size}.json")):
+        if selected and operation not in selected:
+            continue
+        timings = measure(function, repeat)
+        results.append({
+            "size": size,
+            "operation": operation,
+            "best_s": round(min(timings), 6),
+            "mean_s": round(sum(timings) / len(timings), 6),
+            "runs": len(timings),
+        })
+        print(f"{size:>8} {operation:<28} {min(timings) * 1000:>10.3f} мс", file=sys.stderr)
+    return results
+
+
+def run(sizes=DEFAULT_SIZES, seed=0, repeat=5, selected=None):
+    with tempfile.TemporaryDirectory(prefix="contact-book-bench-") as workdir:
+        results = []
+        for size in sizes:
+            results.extend(bench_size(size, seed, repeat, workdir, selected))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "seed": seed,
+            "repeat": repeat,
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Бенчмарк основних операцій книги контактів на синтетичних даних")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="розміри книги через кому, наприклад 1000,10000,100000")
+    parser.add_argument("--seed", type=int, default=0, help="зерно генератора даних")
+    parser.add_argument("--repeat", type=int, default=5, help="кількість повторів кожної операції")
+    parser.add_argument("--operation", action="append", help="виміряти лише цю операцію (можна вказати кілька)")
+    parser.add_argument("--output", default="bench_results.json", help="файл для результатів ('-' для stdout)")
+    return parser
+
+
+def main(argv=None):
+    options = build_parser().parse_args(argv)
+    sizes = [int(size) for size in options.sizes.split(",") if size.strip()]
+    report = run(sizes, options.seed, max(options.repeat, 1), options.operation)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if options.output == "-":
+        print(text)
+    else:
+        with open(options.output, "w", encoding="utf-8") as out:
+            out.write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+import argparse
+import json
+import os
+import socket
+import struct
+import sys
+import tempfile
+
+# Кадр протоколу: 4 байти довжини (big-endian) і JSON в UTF-8
+HEADER = struct.Struct(">I")
+MAX_FRAME = 64 * 1024 * 1024
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), f"contact-book-{os.getuid()}.sock")
+
+
+def encode_frame(message):
+    payload = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    return HEADER.pack(len(payload)) + payload
+
+
+class BookClient:
+    # Тонкий клієнт: не імпортує модель книги, лише надсилає запити демону
+    def __init__(self, path=DEFAULT_SOCKET, timeout=30):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        try:
+            self.sock.connect(path)
+        except OSError:
+            self.sock.close()
+            raise
+        self.file = self.sock.makefile("rb")
+
+    def request(self, message):
+        self.sock.sendall(encode_frame(message))
+        (length,) = HEADER.unpack(self._read(HEADER.size))
+        return json.loads(self._read(length))
+
+    def _read(self, size):
+        data = self.file.read(size)
+        if len(data) < size:
+            raise ConnectionError("Демон закрив з'єднання.")
+        return data
+
+    def run(self, command, *args):
+        return self.request({"op": "run", "command": command, "args": list(args)})
+
+    def search(self, query, limit=50):
+        return self.request({"op": "search", "query": query, "limit": limit})
+
+    def ping(self):
+        return self.request({"op": "ping"})
+
+    def save(self):
+        return self.request({"op": "save"})
+
+    def shutdown(self):
+        return self.request({"op": "shutdown"})
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Клієнт демона книги контактів")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="шлях до сокета демона")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--ping", action="store_true", help="перевірити, чи працює демон")
+    group.add_argument("--search", metavar="QUERY", help="пошук за ім'ям, телефоном, поштою або #хештегом")
+    group.add_argument("--save", action="store_true", help="зберегти книгу на диск")
+    group.add_argument("--shutdown", action="store_true", help="зупинити демон")
+    parser.add_argument("command", nargs="?", help="команда книги, як у Contact_Managment_Book_v2.py")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="аргументи команди")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    options = parser.parse_args(argv)
+    try:
+        with BookClient(options.socket) as client:
+            if options.ping:
+                response = client.ping()
+            elif options.search is not None:
+                response = client.search(options.search)
+            elif options.save:
+                response = client.save()
+            elif options.shutdown:
+                response = client.shutdown()
+            elif options.command:
+                response = client.run(options.command, *options.args)
+            else:
+                parser.print_usage(sys.stderr)
+                return 2
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"Демон не запущено ({options.socket}). Запустіть Contact_Managment_Book_daemon.py.", file=sys.stderr)
+        return 2
+    except ConnectionError as e:
+        print(f"Зв'язок із демоном перервано ({options.socket}): {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(response, ensure_ascii=False))
+    return 0 if response.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
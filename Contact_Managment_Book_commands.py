@@ -0,0 +1,179 @@
+import time
+from contextlib import ExitStack
+
+from Contact_Managment_Book_slowlog import result_count
+
+
+class Command:
+    def __init__(self, name, handler, aliases=(), number=None, prefix=False, description="", mutates=False, params=(), needs_book=True):
+        self.name = name
+        self.handler = handler
+        self.aliases = tuple(aliases)
+        self.number = number
+        self.prefix = prefix
+        self.params = tuple(params)
+        self.description = description
+        self.mutates = mutates
+        self.needs_book = needs_book
+
+    def __call__(self, session):
+        return self.handler(session)
+
+    def __repr__(self):
+        return f"Command({self.name!r})"
+
+
+class MissingArgument(Exception):
+    pass
+
+
+class Session:
+    interactive = True
+
+    def __init__(self, book, registry=None, args=()):
+        self.book = book
+        self.registry = registry
+        self.command = ""
+        self.running = True
+        self.failed = False
+        self.args = list(args)
+        self.data = None
+        self.waited = 0
+        self.answers = []
+
+    def ask(self, prompt):
+        # Аргументи, передані в одному рядку з командою, використовуються замість запитів
+        if self.args:
+            answer = self.args.pop(0)
+        else:
+            # Час очікування введення не зараховується до часу виконання команди
+            started = time.perf_counter_ns()
+            try:
+                answer = input(prompt)
+            finally:
+                self.waited += time.perf_counter_ns() - started
+        self.answers.append(answer)
+        return answer
+
+    def say(self, *parts, **kwargs):
+        print(*parts, **kwargs)
+
+    def fail(self, *parts, **kwargs):
+        self.failed = True
+        self.say(*parts, **kwargs)
+
+
+class CommandRegistry:
+    def __init__(self, metrics=None, slowlog=None):
+        self.metrics = metrics
+        self.slowlog = slowlog
+        self.hooks = []
+        self.commands = {}
+        self._lookup = {}
+        self._numbers = {}
+        self._prefixes = []
+
+    def add(self, command):
+        keys = (command.name,) + command.aliases
+        for key in keys:
+            if key in self._lookup:
+                raise ValueError(f"Команда '{key}' вже зареєстрована.")
+        if command.number is not None and command.number in self._numbers:
+            raise ValueError(f"Номер {command.number} вже зайнятий командою '{self._numbers[command.number].name}'.")
+
+        self.commands[command.name] = command
+        for key in keys:
+            self._lookup[key] = command
+        if command.number is not None:
+            self._numbers[command.number] = command
+            self._lookup[str(command.number)] = command
+        if command.prefix:
+            self._prefixes.append((command.name, command))
+            # Довші префікси перевіряються першими, щоб "find-notion-by-hashtag" не перехопила коротша команда
+            self._prefixes.sort(key=lambda item: len(item[0]), reverse=True)
+        return command
+
+    def command(self, name, aliases=(), number=None, prefix=False, description="", mutates=False, params=(), needs_book=True):
+        def decorator(handler):
+            self.add(Command(name, handler, aliases, number, prefix, description, mutates, params, needs_book))
+            return handler
+        return decorator
+
+    def resolve(self, text):
+        command = self._lookup.get(text)
+        if command is not None:
+            return command
+        for prefix, command in self._prefixes:
+            if text.startswith(prefix):
+                return command
+        return None
+
+    def by_number(self, number):
+        return self._numbers.get(number)
+
+    def dispatch(self, session, text):
+        command = self.resolve(text)
+        if command is None:
+            return None
+        session.command = text
+        session.failed = False
+        session.data = None
+        # Книга, що ще завантажується у фоні, чекає лише на команди, яким потрібні контакти
+        if command.needs_book and session.book is not None:
+            session.book.wait_until_open()
+        if self.metrics is None and self.slowlog is None:
+            self.run(command, session)
+            return command
+        session.waited = 0
+        session.answers = []
+        started = time.perf_counter_ns()
+        failed = True
+        try:
+            self.run(command, session)
+            failed = session.failed
+        finally:
+            elapsed = time.perf_counter_ns() - started - session.waited
+            if self.metrics is not None:
+                self.metrics.record("command", command.name, elapsed, failed)
+            if self.slowlog is not None:
+                self.slowlog.record("command", command.name, elapsed / 1e9, session.answers,
+                                    len(session.book) if session.book is not None else None, result_count(session.data))
+        return command
+
+    def run(self, command, session):
+        if not self.hooks:
+            return command(session)
+        with ExitStack() as stack:
+            for hook in self.hooks:
+                stack.enter_context(hook(command, session))
+            return command(session)
+
+    def add_hook(self, hook):
+        # Хук - функція (command, session), що повертає контекстний менеджер навколо виконання команди;
+        # так до команд під'єднуються власні профайлери чи трасування
+        self.hooks.append(hook)
+        return hook
+
+    def remove_hook(self, hook):
+        self.hooks.remove(hook)
+
+    def keys(self):
+        return self._lookup.keys()
+
+    def suggest(self, user_input):
+        matches = [key for key in self._lookup if key.startswith(user_input)]
+        if len(matches) == 1:
+            return f"Можливо, ви мали на увазі команду: {matches[0]}?\nБудь ласка, спробуйте ще раз."
+        elif matches:
+            return f"Можливо, ви мали на увазі одну з цих команд: {', '.join(matches)}?\nБудь ласка, спробуйте ще раз."
+        else:
+            return "Вибачте, я не зрозумів вашу команду. Спробуйте ще раз або введіть 'h' або 'help' для допомоги."
+
+    def __contains__(self, text):
+        return self.resolve(text) is not None
+
+    def __iter__(self):
+        return iter(self.commands.values())
+
+    def __len__(self):
+        return len(self.commands)
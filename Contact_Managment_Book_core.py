@@ -0,0 +1,1034 @@
+import csv
+import datetime
+import functools
+import gc
+import json
+import threading
+import time
+from collections import UserDict
+from collections.abc import Mapping
+from contextlib import contextmanager
+from itertools import islice
+from Contact_Managment_Book_index import NameIndex, SearchIndex
+from Contact_Managment_Book_indexfile import content_stamp, read_index_file, write_index_file
+from Contact_Managment_Book_locks import NULL_LOCK, ReadWriteLock
+from Contact_Managment_Book_metrics import metrics
+from Contact_Managment_Book_slowlog import slowlog
+from Contact_Managment_Book_tracing import span, traced
+from Contact_Managment_Book_validation import EMAIL_PATTERN, HASHTAG_PATTERN, ValidationReport, is_valid_phone, validate_contacts
+
+# Поля рядка у форматі файлу книги і відповідні поля перевіреного рядка
+PATCH_FIELDS = {"phones": "phones", "email": "email", "birthday": "birthday", "notions": "notions", "addresses": "address"}
+
+_colors = None
+
+def colors():
+    # colorama підключається лише тоді, коли справді потрібен кольоровий вивід
+    global _colors
+    if _colors is None:
+        from colorama import init, Fore, Style
+        init()
+        _colors = (Fore, Style)
+    return _colors
+
+class Address:
+    def __init__(self, address):
+        if len(address) <= 120:
+            self.addresses = [address]
+        else:
+            raise ValueError("\nАдреса перевищує максимально допустиму довжину в 120 символів.")
+
+    def add_address(self, address):
+        if isinstance(address, str):
+            self.addresses.append(address)
+        else:
+            print("\nНедійсний формат адреси. Укажіть рядок.")
+
+    def show_address(self, name):
+        if self.addresses:
+            return f"\nАдреса для контакту {name}: {self.addresses[0]}"
+        else:
+            return "Адреса не була вказана."
+            
+    def edit_address(self, new_address):
+        self.addresses = [new_address]
+        return "Адресу успішно відредаговано."
+
+    def delete_address(self, address):
+        self.addresses = [a for a in self.addresses if str(a) != str(address)]
+
+class Field:
+    def __init__(self, value):
+        self.value = value
+
+    @classmethod
+    def from_valid(cls, value):
+        # Значення вже перевірене пакетною валідацією, тому повторно не перевіряємо
+        field = cls.__new__(cls)
+        field.value = value
+        return field
+
+    def __str__(self):
+        return str(self.value)
+
+class Name(Field):
+    def __init__(self, first_name, last_name=None):
+        if last_name:
+            super().__init__(f"{first_name} {last_name}")
+        else:
+            super().__init__(first_name)
+
+class Phone(Field):
+    def __init__(self, value):
+        if self._validate_phone(value):
+            super().__init__(value)
+        else:
+            raise ValueError("\nНеправильний формат номеру телефону. Номер повинен містити 10 цифр.")
+
+    def _validate_phone(self,value):
+        return is_valid_phone(value)
+
+class Email(Field):
+    pattern = EMAIL_PATTERN
+
+    def __init__(self, value):
+        if self.pattern.match(value):
+            self.value = value
+        else:
+            raise ValueError("Неіснуючий формат адреси електронної пошти.\nПовторіть спробу.")
+
+class Birthday(Field):
+    def __init__(self, value):
+        try:
+            self.value = datetime.datetime.strptime(value, '%d.%m.%Y')
+        except ValueError:
+            raise ValueError("Неправильний формат дати народження. Використовуйте формат ДД.ММ.РРРР.")
+
+    def __str__(self):
+        return self.value.strftime('%d.%m.%Y')
+
+
+
+class Notion:
+    def __init__(self, text, hashtags):
+        self.text = self._validate_text(text)
+        self.hashtags = self._validate_hashtags(hashtags)
+
+    @classmethod
+    def from_valid(cls, text, hashtags):
+        notion = cls.__new__(cls)
+        notion.text = text
+        notion.hashtags = list(hashtags)
+        return notion
+
+    def _validate_text(self, text):
+        if not text or len(text) > 280:
+            raise ValueError("Текст нотатки не може бути порожнім або перевищувати 280 символів.")
+        return text
+
+    @staticmethod
+    def _validate_hashtags(hashtags):
+        validated_hashtags = []
+        for hashtag in hashtags:
+            if HASHTAG_PATTERN.match(hashtag):
+                validated_hashtags.append(hashtag)
+            else:
+                raise ValueError("Неправильний формат хештегу.")
+        return validated_hashtags
+    
+def get_valid_hashtags(ask=input):
+    while True:
+        hashtags_input = ask("Додайте хештеги: ")
+        hashtags = hashtags_input.split()
+        try:
+            validated_hashtags = Notion._validate_hashtags(hashtags)
+            return validated_hashtags
+        except ValueError as e:
+            print(e)
+            print("Будь ласка, спробуйте ввести хештеги ще раз.")
+
+# Назви днів тижня не залежать від локалі системи, на відміну від strftime('%A')
+BIRTHDAY_FROM_WIDTH = 18
+WEEKDAYS = ['Понеділок', 'Вівторок', 'Середа', 'Четвер', 'П"ятниця', 'Субота', 'Неділя']
+
+def birthday_in_year(birthday, year):
+    # 29 лютого в невисокосний рік святкуємо 1 березня
+    try:
+        return birthday.replace(year=year)
+    except ValueError:
+        return birthday.replace(year=year, month=3, day=1)
+
+def next_birthday_date(birthday, today):
+    for year in (today.year, today.year + 1):
+        next_birthday = birthday_in_year(birthday, year)
+        if next_birthday >= today:
+            return next_birthday
+
+class Find:
+    @staticmethod
+    @traced("Find.find_by_name")
+    def find_by_name(address_book, name):
+        found_contacts = []
+        for record in address_book.records():
+            if record.name.value.lower() == name.lower():
+                found_contacts.append(record)
+        return found_contacts
+
+    @staticmethod
+    @traced("Find.find_by_phone")
+    def find_by_phone(address_book, phone):
+        found_contacts = []
+        for record in address_book.records():
+            for record_phone in record.phones:
+                if str(record_phone) == phone:
+                    found_contacts.append(record)
+                    break
+        return found_contacts
+
+    @staticmethod
+    @traced("Find.find_by_birthday")
+    def find_by_birthday(address_book, birthday):
+        found_contacts = []
+        for record in address_book.records():
+            if record.birthday and str(record.birthday) == birthday:
+                found_contacts.append(record)
+        return found_contacts
+    
+    @staticmethod
+    @traced("Find.find_by_address")
+    def find_by_address(address_book, address):
+        found_contacts = []
+        for record in address_book.records():
+            if record.address and address in record.address.addresses:
+                found_contacts.append(record)
+        return found_contacts
+
+    @staticmethod
+    @traced("Find.find_by_email")
+    def find_by_email(address_book, email):
+        found_contacts = []
+        for record in address_book.records():
+            if record.email and record.email.value.lower() == email.lower():
+                found_contacts.append(record)
+        return found_contacts
+
+
+@contextmanager
+def gc_paused():
+    # Масове створення записів не утворює циклів, а збирач сміття інакше запускається тисячі разів
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def changes_record(method):
+    # Зміни контакту виконуються під блокуванням книги на запис, тож читачі не бачать їх наполовину
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock.write():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class Record:
+    lock = NULL_LOCK
+
+    @traced("Record", "model")
+    def __init__(self, name):
+        self.original_name = name
+        self.name = Name(*name.split())
+        self.phones = []
+        self.email = None
+        self.birthday = None
+        self.notions = []
+        self.address = None
+        self.data = {}
+        self._rendered = None
+        self._frozen = None
+        self.on_change = None
+
+    @classmethod
+    def from_valid(cls, row):
+        record = cls(row["name"])
+        record.assign_valid(row)
+        return record
+
+    def assign_valid(self, row, fields=PATCH_FIELDS.values()):
+        # Поля з уже перевіреного рядка; книгу не сповіщає, тож масові зміни оновлюють індекси самі
+        if "phones" in fields:
+            self.phones = [Phone.from_valid(phone) for phone in row["phones"]]
+        if "email" in fields:
+            self.email = Email.from_valid(row["email"]) if row["email"] else None
+        if "birthday" in fields:
+            self.birthday = Birthday.from_valid(row["birthday"]) if row["birthday"] else None
+        if "notions" in fields:
+            self.notions = [Notion.from_valid(notion["text"], notion["hashtags"]) for notion in row["notions"]]
+        if "address" in fields:
+            self.address = Address(row["address"]) if row["address"] else None
+        self._rendered = None
+        self._frozen = None
+
+    def invalidate(self):
+        # Скидаємо закешований рядок і незмінну копію після будь-якої зміни контакту і повідомляємо книгу
+        self._rendered = None
+        self._frozen = None
+        if self.on_change is not None:
+            self.on_change(self)
+
+    def frozen(self):
+        # Незмінна версія контакту для знімків книги; створюється заново лише після зміни
+        if self._frozen is None:
+            version = Record.__new__(Record)
+            version.__dict__.update(self.__dict__)
+            version.phones = list(self.phones)
+            version.notions = [Notion.from_valid(notion.text, notion.hashtags) for notion in self.notions]
+            if self.address is not None:
+                version.address = Address.__new__(Address)
+                version.address.addresses = list(self.address.addresses)
+            version.on_change = None
+            version.lock = NULL_LOCK
+            version._frozen = version
+            self._frozen = version
+        return self._frozen
+
+    @changes_record
+    def add_phone(self, phone):
+        try:
+            self.phones.append(Phone(phone))
+        except ValueError as e:
+            print(e)
+        else:
+            self.invalidate()
+
+    @changes_record
+    def remove_phone(self, phone):
+        self.phones = [p for p in self.phones if str(p) != phone]
+        self.invalidate()
+
+    @changes_record
+    def edit_phone(self, old_phone_index, new_phone):
+        try:
+            old_phone_index = int(old_phone_index)
+        except ValueError:
+            print("\nНевірний індекс номеру телефону. Будь ласка, введіть коректний номер.")
+            return None
+        if not 0 <= old_phone_index < len(self.phones):
+            print("\nНевірний індекс номеру телефону.")
+            return None
+        # Помилка в самому номері повідомляється окремо, а не як неправильний індекс
+        try:
+            phone = Phone(new_phone)
+        except ValueError as e:
+            print(e)
+            return None
+        self.phones[old_phone_index] = phone
+        self.invalidate()
+        return "\nНомер телефону успішно змінено."
+
+    def add_record(self, record):
+        self.data[record.name.value.lower()] = record
+
+    def delete(self, name):
+        pass
+
+    def display_phones(self):
+        for i, phone in enumerate(self.phones):
+            print(f"{i}: {phone}")
+
+
+    def find_phone(self, phone):
+        for p in self.phones:
+            if str(p) == phone:
+                return p
+        return None
+
+    @changes_record
+    def add_email(self, email):
+        self.email = Email(email)
+        self.invalidate()
+
+    def show_email(self):
+        if self.email:
+            return str(self.email)
+        else:
+            return "не додана"
+
+    @changes_record
+    def edit_email(self, new_email):
+        if self.email is not None:
+            self.email = Email(new_email)
+            self.invalidate()
+        else:
+            self.add_email(new_email)
+
+    @changes_record
+    def delete_email(self, email_address):
+        if self.email is not None:
+            if self.email.value == email_address:
+                self.email = None
+                self.invalidate()
+                print("Електронну пошту успішно видалено!")
+            else:
+                print("Електронна пошта не знайдена.")
+        else:
+            print("Контакт не має електронної пошти для видалення.")
+
+    @changes_record
+    def add_birthday(self, birthday):
+        self.birthday = Birthday(birthday)
+        self.invalidate()
+
+    def show_birthday(self):
+        if self.birthday:
+            return str(self.birthday)
+        else:
+            return "не додано"
+    
+    @changes_record
+    def add_notion(self, text, hashtags):
+        hashtag_list = hashtags
+        self.notions.append(Notion(text, hashtags))
+        self.invalidate()
+
+    @changes_record
+    def edit_notion(self, index, new_text, new_hashtags):
+        try:
+            index = int(index)
+            if 0 <= index < len(self.notions):
+                self.notions[index] = Notion(new_text, new_hashtags)
+                self.invalidate()
+                return "Нотатку успішно змінено."
+            else:
+                return "Неправильний індекс нотатки."
+        except ValueError as e:
+            print(e)
+
+    @changes_record
+    def delete_notion(self, index):
+        try:
+            index = int(index)
+            if 0 <= index < len(self.notions):
+                del self.notions[index]
+                self.invalidate()
+                return "Нотатку успішно видалено."
+            else:
+                print("Неправильний індекс нотатки.")
+        except ValueError as e:
+            print(e)
+
+    def to_dict(self):
+        return {
+            'name': str(self.name),
+            'phones': [str(phone) for phone in self.phones],
+            "email": str(self.email) if self.email else None,
+            'birthday': str(self.birthday) if self.birthday else None,
+            'notions': [{'text': notion.text, 'hashtags': notion.hashtags} for notion in self.notions],
+            "addresses": self.address.addresses if self.address else []
+        }
+
+    def __str__(self):
+        if self._rendered is None:
+            self._rendered = self._render()
+        return self._rendered
+
+    def _render(self):
+        phones_str = '; '.join([str(phone) for phone in self.phones])
+        birthday_str = self.show_birthday() if self.birthday else "не додано"
+        notions_str = '; '.join([f"{notion.text} (Хештеги: {' '.join(notion.hashtags)})" for notion in self.notions])
+        address_str = ', '.join(self.address.addresses) if hasattr(self, 'address') and self.address else "не додана"
+        return f"Ім'я контакту: {self.original_name}, Телефони: {phones_str}, Електронна пошта: {self.show_email()}, День народження: {birthday_str}, Нотатки: {notions_str}, Адреса: {address_str}"
+
+    @changes_record
+    def add_hashtag_to_notion(self, notion_index, hashtag):
+        try:
+            notion_index = int(notion_index)
+            if 0 <= notion_index < len(self.notions):
+                if f"#{hashtag}" not in self.notions[notion_index].hashtags:
+                    self.notions[notion_index].hashtags.append(f"#{hashtag}")
+                    self.invalidate()
+                    print(f"Хештег #{hashtag} успішно додано до нотатки.")
+                else:
+                    print(f"Хештег #{hashtag} вже існує в цій нотатці.")
+            else:
+                print("Невірний індекс нотатки.")
+        except ValueError as e:
+            print("Помилка при додаванні хештегу:", e)
+
+    @changes_record
+    def remove_hashtag_from_notion(self, notion_index, hashtag):
+        try:
+            notion_index = int(notion_index)
+            if 0 <= notion_index < len(self.notions):
+                if f"#{hashtag}" in self.notions[notion_index].hashtags:
+                    self.notions[notion_index].hashtags.remove(f"#{hashtag}")
+                    self.invalidate()
+                    print(f"Хештег #{hashtag} успішно видалено з нотатки.")
+                else:
+                    print(f"Хештег #{hashtag} не знайдено в цій нотатці.")
+            else:
+                print("Невірний індекс нотатки.")
+        except ValueError as e:
+            print("Помилка при видаленні хештегу:", e)
+
+    @changes_record
+    def add_address(self, address):
+        self.address = Address(address)
+        self.invalidate()
+
+    @changes_record
+    def edit_address(self, new_address):
+        self.address.edit_address(new_address)
+        self.invalidate()
+
+    @changes_record
+    def delete_address(self, address):
+        self.address = None
+        self.invalidate()
+    
+    def show_address(self):
+        if self.address:
+            return self.address.show_address(self.name.value)
+        else:
+            return "Адреса не знайдена."
+
+class Snapshot(Mapping):
+    # Зріз книги на певний момент: записи в ньому більше не змінюються, тож його читають без блокувань
+    def __init__(self, data):
+        self.data = data
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def find(self, name):
+        return self.data.get(name.lower())
+
+    def records(self):
+        return list(self.data.values())
+
+
+class AddressBook(UserDict):
+    def __init__(self, filename="contacts_book.json", lazy=False, thread_safe=False):
+        super().__init__()
+        # У потокобезпечному режимі читання йдуть паралельно, а зміни - короткими виключними секціями
+        self.lock = ReadWriteLock() if thread_safe else NULL_LOCK
+        self.filename = filename
+        self.validation_report = None
+        self.names = NameIndex()
+        self._search = None
+        self._versions = None
+        self._versions_shared = False
+        # (файл, відбиток його вмісту), якщо книга точно збігається з цим файлом; будь-яка зміна скидає в None
+        self.stamp = None
+        self._changes = 0
+        self.loaded = False
+        self._opening = None
+        self._open_error = None
+        if not lazy:
+            self.open()
+
+    def open(self, progress=None):
+        # Файл книги читається лише один раз, повторні виклики нічого не роблять
+        if not self.loaded:
+            self.load_from_json(self.filename, progress)
+            self.loaded = True
+        return self
+
+    def open_in_background(self):
+        # Швидкий старт: підказка з'являється одразу, а файл читається окремим потоком
+        def load():
+            try:
+                self.open()
+            except Exception as e:
+                self._open_error = e
+
+        self._opening = threading.Thread(target=load, name="book-loader", daemon=True)
+        self._opening.start()
+        return self
+
+    def wait_until_open(self):
+        opening = self._opening
+        if opening is None:
+            return self
+        if opening.is_alive():
+            print("Зачекайте, книга контактів ще завантажується...")
+            opening.join()
+        self._opening = None
+        if self._open_error is not None:
+            error, self._open_error = self._open_error, None
+            raise error
+        return self
+
+    def add_record(self, record):
+        key = record.name.value.lower()
+        with self.lock.write():
+            self.data[key] = record
+            self.names.add(key)
+            record.on_change = self.record_changed
+            record.lock = self.lock
+            if self._search is not None:
+                self._search.add(key, record)
+            self._set_version(key, record)
+
+    def record_changed(self, record):
+        key = record.name.value.lower()
+        with self.lock.write():
+            if self.data.get(key) is record:
+                if self._search is not None:
+                    self._search.add(key, record)
+                self._set_version(key, record)
+
+    def _set_version(self, key, record=None):
+        # Викликається під блокуванням на запис при кожній зміні книги. Словник версій, який уже
+        # віддано знімку, спершу копіюється, тож знімок ніколи не бачить пізніших змін
+        self.stamp = None
+        self._changes += 1
+        if self._versions is None:
+            return
+        if self._versions_shared:
+            self._versions = dict(self._versions)
+            self._versions_shared = False
+        if record is None:
+            self._versions.pop(key, None)
+        else:
+            self._versions[key] = record.frozen()
+
+    def snapshot(self):
+        # Знімок коштує O(1): повна копія робиться лише при першому виклику,
+        # а далі словник версій оновлюється разом із книгою
+        with self.lock.write():
+            if self._versions is None:
+                self._versions = {key: record.frozen() for key, record in self.data.items()}
+            self._versions_shared = True
+            return Snapshot(self._versions)
+
+    def consistent_view(self):
+        # Без потокобезпечного режиму книгу ніхто не змінює паралельно, тож знімок не потрібен
+        if self.lock is NULL_LOCK:
+            return self.data
+        return self.snapshot()
+
+    def search_index(self):
+        # Індекс пошуку з'являється при першому запиті, а далі оновлюється разом із книгою.
+        # Поки книга збігається з файлом, індекс береться з файлу індексів поруч, а побудований
+        # заново туди записується, щоб наступний запуск його вже не будував
+        built = False
+        if self._search is None:
+            with self.lock.write():
+                stamp = self.stamp
+                if self._search is None and stamp is not None:
+                    with gc_paused(), span("read_search_index", "index") as current:
+                        search = read_index_file(*stamp, "search")
+                        if search is not None and len(search) == len(self.data):
+                            self._search = search
+                        current.set(found=self._search is not None)
+                if self._search is None:
+                    with gc_paused(), span("build_search_index", "index", records=len(self.data)):
+                        self._search = SearchIndex(self.data)
+                    built = True
+        if built:
+            self.save_indexes()
+        return self._search
+
+    def save_indexes(self):
+        # Записує індекси поруч із файлом, з яким книга зараз збігається; без такого файлу нічого не робить.
+        # Індекс імен пишеться завжди, а індекс пошуку - лише якщо його вже побудовано
+        with self.lock.read():
+            if self.stamp is None:
+                return None
+            filename, stamp = self.stamp
+            try:
+                with span("write_indexes", "index", records=len(self.names)):
+                    return write_index_file(filename, stamp, self.names, self._search)
+            except OSError:
+                # Файл індексів лише пришвидшує запуск, тож книга без нього працює як завжди
+                return None
+
+    def search(self, query, limit=50):
+        started = time.perf_counter()
+        with span("search", "query", query_length=len(query), limit=limit) as current:
+            index = self.search_index()
+            with self.lock.read():
+                data = self.data
+                found = [data[key] for key in index.search(query, limit) if key in data]
+            current.set(results=len(found))
+        slowlog.record("search", "search", time.perf_counter() - started, (query,), len(data), len(found))
+        return found
+
+    def records(self):
+        # Список записів на поточний момент: його можна обходити, поки інші потоки змінюють книгу
+        with self.lock.read():
+            return list(self.data.values())
+
+    def find(self, name):
+        name_lower = name.lower()
+        return self.data.get(name_lower)
+
+    def delete(self, name):
+        name_lower = name.lower()
+        with self.lock.write():
+            record = self.data.pop(name_lower, None)
+            if record is not None:
+                record.on_change = None
+                record.lock = NULL_LOCK
+                self.names.remove(name_lower)
+                if self._search is not None:
+                    self._search.remove(name_lower)
+                self._set_version(name_lower)
+        if record is not None:
+            return f"Контакт {name} видалено успішно."
+        else:
+            print("Контакт не знайдено.")
+
+    def _adopt(self, record):
+        record.on_change = self.record_changed
+        record.lock = self.lock
+        return record
+
+    def _store_many(self, records):
+        # Викликається під блокуванням на запис; кожен індекс оновлюється один раз на весь пакет
+        new_keys = [key for key in records if key not in self.data]
+        for key, record in records.items():
+            old = self.data.get(key)
+            if old is not None and old is not record:
+                old.on_change = None
+                old.lock = NULL_LOCK
+        self.data.update(records)
+        self.names.add_many(new_keys)
+        if self._search is not None:
+            self._search.add_many(records)
+        for key, record in records.items():
+            self._set_version(key, record)
+
+    def add_records(self, records):
+        # Приймає записи Record або словники у форматі файлу книги; словники перевіряються одним пакетом
+        records = list(records)
+        batch = {}
+        with gc_paused():
+            report = validate_contacts([item for item in records if not isinstance(item, Record)])
+            for record in [item for item in records if isinstance(item, Record)]:
+                batch[record.name.value.lower()] = self._adopt(record)
+            for row in report.rows:
+                record = self._adopt(Record.from_valid(row))
+                batch[record.name.value.lower()] = record
+        with self.lock.write():
+            self._store_many(batch)
+        return report
+
+    def update_many(self, patches):
+        # Латка - словник з ім'ям контакту і лише тими полями, які треба замінити.
+        # Латка з будь-якою помилкою не застосовується зовсім, щоб не стерти правильне поле
+        patches = list(patches)
+        report = validate_contacts(patches)
+        unnamed = {issue.row for issue in report.errors if issue.field in ("name", "record")}
+        rejected = {issue.row for issue in report.errors}
+        indexes = [index for index in range(len(patches)) if index not in unnamed]
+        changed = {}
+        applied = []
+        with self.lock.write():
+            for index, row in zip(indexes, report.rows):
+                if index in rejected:
+                    continue
+                key = row["name"].lower()
+                record = self.data.get(key)
+                if record is None:
+                    report.add_error(index, "name", row["name"], "Контакт не знайдено.")
+                    continue
+                record.assign_valid(row, [PATCH_FIELDS[field] for field in patches[index] if field in PATCH_FIELDS])
+                changed[key] = record
+                applied.append(row)
+            self._store_many(changed)
+        report.errors.sort(key=lambda issue: issue.row)
+        # Лише застосовані рядки: відхилена латка з тим самим ім'ям сюди не потрапляє
+        report.rows = applied
+        return report
+
+    def delete_many(self, names):
+        deleted = []
+        with self.lock.write():
+            for name in names:
+                record = self.data.pop(name.lower(), None)
+                if record is not None:
+                    record.on_change = None
+                    record.lock = NULL_LOCK
+                    deleted.append(name.lower())
+            self.names.remove_many(deleted)
+            if self._search is not None:
+                self._search.remove_many(deleted)
+            for key in deleted:
+                self._set_version(key)
+        return deleted
+
+    @traced("find_by_notion_or_hashtag")
+    def find_by_notion_or_hashtag(self, hashtag):
+        found_records = []
+        with self.lock.read():
+            for record in self.data.values():
+                for notion in record.notions:
+                    if hashtag in notion.hashtags:
+                        found_records.append(record)
+                        break  # Зупиняємо пошук, якщо знайдено хештег
+        return found_records
+
+    @traced("sort_by_hashtag")
+    def sort_by_hashtag(self, hashtag):
+        sorted_records = []
+        with self.lock.read():
+            for record in self.data.values():
+                for notion in record.notions:
+                    if hashtag in notion.hashtags:
+                        sorted_records.append(record.name.value)
+                        break  # Зупиняємо, якщо знайдено хештег
+        return sorted(sorted_records, key=lambda x: x.lower())
+
+    def all_names(self):
+            formatted_names = []
+            with self.lock.read():
+                keys = list(self.data.keys())
+            for name in keys:
+                formatted_name = ' '.join([part.capitalize() for part in name.split()])
+                formatted_names.append(formatted_name)
+            return formatted_names
+
+    def upcoming_birthdays(self, days=7, today=None):
+        today = today or datetime.date.today()
+        upcoming = []
+        for record in self.consistent_view().values():
+            if record.birthday:
+                next_birthday = next_birthday_date(record.birthday.value.date(), today)
+                if (next_birthday - today).days < days:
+                    upcoming.append((next_birthday, record))
+        upcoming.sort(key=lambda item: item[0])
+        return upcoming
+
+    def birthdays(self):
+        # Кольоровий вивід у консоль; список лишається порожнім, як і раніше
+        print(format_birthdays(self.birthdays_by_day(), colored=True), end="")
+        return []
+
+    def birthdays_by_day(self, records=None):
+        # Групування днів народження за днями тижня, спільне для консолі й графічного інтерфейсу
+        records = self.consistent_view().values() if records is None else records
+        today = datetime.datetime.now()
+        birthdays_this_week = {'Понеділок': [], 'Вівторок': [], 'Середа': [], 'Четвер': [], 'П"ятниця': [], 'Субота': [], 'Неділя': [], 'Сьогодні': []}
+        from_day_column_width = BIRTHDAY_FROM_WIDTH
+
+        for record in records:
+            if record.birthday:
+                birthday_date = record.birthday.value
+                next_birthday = birthday_in_year(birthday_date, today.year)
+                delta_days = (next_birthday - today).days
+                birthday_weekday = WEEKDAYS[next_birthday.weekday()]
+
+                if next_birthday < today and (birthday_weekday == 'Субота' or birthday_weekday == 'Неділя') and birthday_weekday != 'П"ятниця' and birthday_weekday != 'Четвер':
+                    from_day = f' (from {birthday_weekday})'.ljust(from_day_column_width)  # Заповнюємо стовпець from
+                    birthdays_this_week['Понеділок'].append((record, from_day)) # Додаємо до списку для понеділка
+
+                # Обробка днів народження для попереднього коду
+                if delta_days == 7:
+                    if 'Наступний понеділок' not in birthdays_this_week:
+                        birthdays_this_week['Наступний понеділок'] = []
+                    birthdays_this_week['Наступний понеділок'].append(f"{record.name.value} (will be on {birthday_weekday})")
+                elif 0 <= delta_days < 7:
+                    if birthday_weekday in ['Субота', 'Неділя']:
+                        if 'Наступний понеділок' not in birthdays_this_week:
+                            birthdays_this_week['Наступний понеділок'] = []
+                        birthdays_this_week['Наступний понеділок'].append(f"{record.name.value} (from {birthday_weekday})")
+                    else:
+                        birthdays_this_week[birthday_weekday].append(record.name.value)
+
+                # Обробка днів народження для другого коду
+                if next_birthday.strftime('%d.%m') == today.strftime('%d.%m'):
+                    birthdays_this_week[birthday_weekday].append((record, ''))
+                else:
+                    if delta_days == 0 and birthday_date.strftime('%d.%m') == today.strftime('%d.%m'):
+                        birthdays_this_week['Сьогодні'].append((record, ''))
+                    elif 0 <= delta_days < 6:
+                        from_day = ''
+                        if birthday_weekday == 'Субота' or birthday_weekday == 'Неділя':
+                            birthday_weekday = 'Понеділок'
+                            from_day = f' (from {birthday_weekday})'.ljust(from_day_column_width)
+                        elif record not in birthdays_this_week[birthday_weekday]:
+                            birthdays_this_week[birthday_weekday].append((record, from_day))
+
+        return birthdays_this_week
+    
+    def edit_address(self, name, new_address):
+        name_key = name.lower()
+        if name_key in self.data:
+            record = self.data[name_key]
+            if record.address:
+                record.edit_address(new_address)
+                print(f"Адресу для {name} було успішно змінено на {new_address}.")
+            else:
+                print(f"До {name} ще не додано жодної адреси.")
+        else:
+            print(f"Контакт {name} не знайдено.")
+#_______________________________________________________________________________________________________________________________
+    def save_to_json(self, filename="contacts_book.json", records=None):
+        # Запис іде зі знімка, тож зміни книги під час збереження не чекають і не потрапляють у файл наполовину
+        started = time.perf_counter()
+        with metrics.timer("storage", "save_to_json"), span("save_to_json", "storage", file=filename) as current:
+            # Лічильник змін береться до знімка: якщо до кінця запису книгу ніхто не змінив,
+            # вона збігається з записаним файлом і її індекси можна зберегти поруч
+            changes = None
+            if records is None:
+                with self.lock.read():
+                    changes = self._changes
+            with span("snapshot", "storage"):
+                records = self.consistent_view().values() if records is None else records
+            with span("serialize", "storage"):
+                json_data = [record.to_dict() for record in records]
+                raw = json.dumps(json_data, ensure_ascii=False, indent=4).encode("utf-8")
+            with span("write", "storage"), open(filename, 'wb') as f:
+                f.write(raw)
+                current.set(records=len(json_data), bytes=len(raw))
+            if changes is not None:
+                with self.lock.write():
+                    if self._changes == changes:
+                        self.stamp = (filename, content_stamp(raw))
+                self.save_indexes()
+        slowlog.record("storage", "save_to_json", time.perf_counter() - started, (filename,), len(self), len(json_data))
+        return "Дані успішно збережено у файлі " + filename + "."
+
+    def export_csv(self, filename="contacts_book.csv"):
+        view = self.consistent_view()
+        with open(filename, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["name", "phones", "email", "birthday", "notions", "address"])
+            for record in view.values():
+                writer.writerow([
+                    str(record.name),
+                    "; ".join(str(phone) for phone in record.phones),
+                    str(record.email) if record.email else "",
+                    str(record.birthday) if record.birthday else "",
+                    "; ".join(f"{notion.text} {' '.join(notion.hashtags)}".strip() for notion in record.notions),
+                    ", ".join(record.address.addresses) if record.address else "",
+                ])
+        return "Дані успішно експортовано у файл " + filename + "."
+
+    def load_from_json(self, filename="contacts_book.json", progress=None):
+        started = time.perf_counter()
+        with metrics.timer("storage", "load_from_json"), span("load_from_json", "storage", file=filename) as current:
+            report = self._load_from_json(filename, progress)
+            current.set(records=len(self))
+        slowlog.record("storage", "load_from_json", time.perf_counter() - started, (filename,), len(self),
+                       len(report.rows) if report is not None else None)
+        return report
+
+    def _load_from_json(self, filename, progress):
+        try:
+            with open(filename, 'rb') as f:
+                with span("read", "storage") as current:
+                    raw = f.read()
+                    current.set(bytes=len(raw))
+            with span("parse", "storage"):
+                data = json.loads(raw)
+        except FileNotFoundError:
+            print("Файл не знайдено. Буде створено новий файл при збереженні.")
+            return None
+        except OSError as e:
+            print(f"Не вдалося прочитати файл {filename}: {e.strerror or e}.")
+            return None
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            print("Помилка при завантаженні даних. Файл може бути пошкоджений.")
+            return None
+        if not isinstance(data, list):
+            print("Помилка при завантаженні даних. Файл може бути пошкоджений.")
+            return None
+        # Збережений індекс імен підходить лише до файлу з тим самим вмістом
+        stamp = (filename, content_stamp(raw))
+        with span("read_name_index", "index") as current:
+            names = read_index_file(*stamp, "names")
+            current.set(found=names is not None)
+        report = self.import_records(data, progress=progress, names=names, stamp=stamp)
+        print("Дані успішно завантажено з файлу " + filename + ".")
+        return report
+
+    def import_records(self, records_data, replace=True, progress=None, names=None, stamp=None):
+        # Нові записи збираються окремо і підставляються одним присвоєнням, тож скасоване
+        # завантаження не залишає книгу напівзаповненою, а читачі не чекають на розбір файлу
+        records = {}
+        with gc_paused():
+            with span("validate", "storage", rows=len(records_data)) as current:
+                report = validate_contacts(records_data)
+                current.set(errors=len(report.errors))
+            total = len(report.rows)
+            step = max(total // 100, 1)
+            with span("build_records", "storage", records=total):
+                for done, row in enumerate(report.rows):
+                    record = self._adopt(Record.from_valid(row))
+                    records[record.name.value.lower()] = record
+                    if progress is not None and done % step == 0:
+                        progress(done, total)
+        if progress is not None:
+            progress(total, total)
+        if replace:
+            if names is None or len(names) != len(records):
+                with span("index", "index", records=len(records)):
+                    names = NameIndex(records)
+            with self.lock.write():
+                self.data = records
+                self.names = names
+                self._search = None
+                self._versions = None
+                self._versions_shared = False
+                self.stamp = stamp
+        else:
+            with self.lock.write():
+                self._store_many(records)
+        self.validation_report = report
+        self.loaded = True
+        if report.errors:
+            print(f"Пропущено некоректних значень: {len(report.errors)}.")
+        return report
+#_______________________________________________________________________________________________________________________________
+def format_birthdays(birthdays_this_week, colored=False):
+    # Текст для консолі (з кольорами colorama) і для вікна (без них) з одного групування
+    if colored:
+        Fore, Style = colors()
+        cyan, yellow, magenta, reset = Fore.CYAN, Fore.YELLOW, Fore.MAGENTA, Style.RESET_ALL
+    else:
+        cyan = yellow = magenta = reset = ""
+    output = "Майбутні дні народження:\n"
+    for day, contacts in birthdays_this_week.items():
+        if day != 'Сьогодні' and contacts:
+            output += f"\n{day}:\n"
+            for contact_data in contacts:
+                if isinstance(contact_data, tuple):
+                    contact, from_day = contact_data
+                    name_padding = 30 - len(contact.name.value)
+                    birthday_padding = 12 - len(contact.show_birthday())
+                    from_day_text = from_day if from_day else "".ljust(BIRTHDAY_FROM_WIDTH)
+                    email_padding = 30 - len(contact.show_email())
+                    output += (
+                        cyan + f"{contact.name.value}{' ' * name_padding}" +
+                        yellow + f"{from_day_text}" +
+                        magenta + " | " +
+                        cyan + f"{contact.show_birthday()}{' ' * birthday_padding}" +
+                        magenta + " | " +
+                        cyan + f"{', '.join(str(phone) for phone in contact.phones)}" +
+                        magenta + " | " +
+                        cyan + f"{contact.show_email()}{' ' * email_padding}" +
+                        (magenta + " | " + reset if colored else "") + "\n"
+                    )
+                else:
+                    # Пропускаємо обробку елемента, який не відповідає очікуваному формату
+                    continue
+    return output
+
+
+def render_records(records, separator="\n", start=0, count=None):
+    # Одна сторінка виводу збирається одним рядком із закешованих представлень контактів
+    if start or count is not None:
+        records = islice(records, start, None if count is None else start + count)
+    return separator.join(map(str, records))
@@ -0,0 +1,180 @@
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import traceback
+from contextlib import redirect_stdout
+
+from Contact_Managment_Book_batch import BatchSession, execute
+from Contact_Managment_Book_client import DEFAULT_SOCKET, HEADER, MAX_FRAME, encode_frame
+from Contact_Managment_Book_core import AddressBook
+from Contact_Managment_Book_v2 import registry
+
+
+class BookServer:
+    # Книга та її індекси завантажуються один раз і обслуговують усіх клієнтів з однієї петлі asyncio
+    def __init__(self, book, registry, path=DEFAULT_SOCKET, autosave=5.0):
+        self.book = book
+        self.registry = registry
+        self.path = path
+        self.autosave = autosave
+        self.session = BatchSession(book, registry)
+        self.dirty = False
+        self.requests = 0
+        self.clients = 0
+        self.stopping = None
+
+    async def serve(self):
+        self.stopping = asyncio.Event()
+        server = await self.start_server()
+        flusher = asyncio.create_task(self.flush_periodically()) if self.autosave else None
+        try:
+            await self.stopping.wait()
+        finally:
+            if flusher is not None:
+                flusher.cancel()
+            server.close()
+            await server.wait_closed()
+            try:
+                await self.flush()
+            finally:
+                self.cleanup()
+
+    async def start_server(self):
+        self.remove_stale_socket()
+        server = await asyncio.start_unix_server(self.handle, path=self.path)
+        os.chmod(self.path, 0o600)
+        return server
+
+    def cleanup(self):
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def remove_stale_socket(self):
+        if not os.path.exists(self.path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.path)
+        except OSError:
+            # Сокет залишився від демона, що аварійно завершився
+            os.unlink(self.path)
+        else:
+            raise RuntimeError(f"Демон вже працює: {self.path}")
+        finally:
+            probe.close()
+
+    async def handle(self, reader, writer):
+        self.clients += 1
+        try:
+            while True:
+                (length,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+                if length > MAX_FRAME:
+                    writer.write(encode_frame({"ok": False, "error": "Запит завеликий."}))
+                    break
+                payload = await reader.readexactly(length)
+                try:
+                    response = self.dispatch(json.loads(payload))
+                except (ValueError, TypeError, KeyError, AttributeError) as e:
+                    response = {"ok": False, "error": f"Неправильний запит: {e}"}
+                except Exception as e:
+                    # Помилка в обробці запиту не обриває з'єднання: клієнт отримує відповідь і може надсилати далі
+                    traceback.print_exc(file=sys.stderr)
+                    response = {"ok": False, "error": f"Внутрішня помилка демона: {e}"}
+                writer.write(encode_frame(response))
+                await writer.drain()
+                if self.stopping.is_set():
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            self.clients -= 1
+            writer.close()
+
+    def dispatch(self, request):
+        self.requests += 1
+        op = request.get("op", "run")
+        if op == "run":
+            result = execute(self.session, request["command"], request.get("args", []))
+            command = self.registry.commands.get(result["command"])
+            if result["ok"] and command is not None and command.mutates:
+                self.dirty = True
+            return result
+        if op == "search":
+            records = self.book.search(request["query"], int(request.get("limit", 50)))
+            return {"ok": True, "data": [record.to_dict() for record in records]}
+        if op == "ping":
+            return {"ok": True, "records": len(self.book), "requests": self.requests, "clients": self.clients, "dirty": self.dirty}
+        if op == "save":
+            try:
+                self.save()
+            except OSError as e:
+                return {"ok": False, "error": f"Не вдалося зберегти книгу: {e}"}
+            return {"ok": True, "saved": self.book.filename}
+        if op == "shutdown":
+            self.stopping.set()
+            return {"ok": True}
+        return {"ok": False, "error": f"Невідома операція: {op}"}
+
+    def save(self):
+        self.dirty = False
+        try:
+            self.book.save_to_json(self.book.filename)
+        except BaseException:
+            # Незбережені зміни не губляться: наступне збереження спробує ще раз
+            self.dirty = True
+            raise
+
+    async def flush(self):
+        if not self.dirty:
+            return
+        # Прапорець скидається до знімка, тож зміни, що прийдуть під час запису, знову позначать книгу
+        self.dirty = False
+        try:
+            # Знімок книги береться в петлі, а сам запис файлу йде в окремому потоці
+            view = self.book.consistent_view()
+            await asyncio.get_running_loop().run_in_executor(None, self.book.save_to_json, self.book.filename, view.values())
+        except BaseException:
+            self.dirty = True
+            raise
+
+    async def flush_periodically(self):
+        # Помилка запису не зупиняє автозбереження: вона записується в журнал, а спроба повториться
+        while True:
+            await asyncio.sleep(self.autosave)
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"Не вдалося зберегти книгу {self.book.filename}: {e}", file=sys.stderr)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Демон книги контактів")
+    parser.add_argument("--file", default="contacts_book.json", help="файл книги контактів")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="шлях до сокета")
+    parser.add_argument("--autosave", type=float, default=5.0, help="інтервал збереження змін у секундах (0 - лише при зупинці)")
+    return parser
+
+
+def main(argv=None):
+    options = build_parser().parse_args(argv)
+    with redirect_stdout(sys.stderr):
+        book = AddressBook(options.file, thread_safe=True)
+    # Індекс пошуку будується до першого клієнта, щоб перший запит не чекав на нього
+    book.search_index()
+    server = BookServer(book, registry, options.socket, options.autosave)
+    print(f"Книгу {options.file} завантажено ({len(book)} контактів), сокет {options.socket}.", file=sys.stderr)
+    try:
+        asyncio.run(server.serve())
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
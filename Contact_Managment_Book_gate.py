@@ -0,0 +1,136 @@
+import argparse
+import contextlib
+import io
+import json
+import sys
+
+from Contact_Managment_Book_bench import measure, run
+from Contact_Managment_Book_core import AddressBook
+from Contact_Managment_Book_generator import generate_contacts
+from Contact_Managment_Book_memstats import memory_report
+
+DEFAULT_BASELINE = "bench_baseline.json"
+DATASET = {"sizes": [10000], "seed": 0, "repeat": 7}
+TOLERANCES = {"default": 0.30, "memory_per_contact": 0.05}
+# Різниця, меншу за цю, не вважаємо регресією навіть у відсотках: для мікросекундних операцій це шум
+NOISE_FLOOR_S = 0.00002
+
+
+def calibrate():
+    # Фіксоване чисто пайтонівське навантаження: відношення його часу до базового
+    # показує, наскільки поточна машина швидша чи повільніша за ту, де знімали базу
+    def workload():
+        words = {f"contact {number}": number for number in range(50000)}
+        sorted(words, key=str.lower)
+    return min(measure(workload, 5))
+
+
+def collect(dataset=DATASET):
+    report = run(dataset["sizes"], dataset["seed"], dataset["repeat"])
+    metrics = {f"{row['operation']}@{row['size']}": row["best_s"] for row in report["results"]}
+    for size in dataset["sizes"]:
+        book = AddressBook(lazy=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            book.import_records(list(generate_contacts(size, dataset["seed"])))
+        metrics[f"memory_per_contact@{size}"] = memory_report(book, top=0)["per_contact_bytes"]
+    return report["meta"], metrics
+
+
+def tolerance_for(name, tolerances):
+    return tolerances.get(name.split("@")[0], tolerances.get("default", TOLERANCES["default"]))
+
+
+def compare(baseline, current, calibration=None, tolerances=None):
+    tolerances = dict(TOLERANCES, **(tolerances or baseline.get("tolerances", {})))
+    scale = 1.0
+    base_calibration = baseline.get("meta", {}).get("calibration_s")
+    if calibration and base_calibration:
+        scale = calibration / base_calibration
+    rows = []
+    for name, base_value in sorted(baseline["metrics"].items()):
+        value = current.get(name)
+        if value is None:
+            rows.append({"metric": name, "baseline": base_value, "current": None, "delta_pct": None, "status": "missing"})
+            continue
+        # Час нормалізується на швидкість машини, пам'ять порівнюється як є
+        is_memory = name.startswith("memory_")
+        expected = base_value if is_memory else base_value * scale
+        delta = (value - expected) / expected if expected else 0.0
+        tolerance = tolerance_for(name, tolerances)
+        regressed = delta > tolerance and (is_memory or value - expected > NOISE_FLOOR_S)
+        rows.append({
+            "metric": name,
+            "baseline": round(expected, 6),
+            "current": value,
+            "delta_pct": round(delta * 100, 1),
+            "tolerance_pct": round(tolerance * 100, 1),
+            "status": "fail" if regressed else "pass",
+        })
+    for name in sorted(set(current) - set(baseline["metrics"])):
+        rows.append({"metric": name, "baseline": None, "current": current[name], "delta_pct": None, "status": "new"})
+    return {"scale": round(scale, 3), "passed": all(row["status"] != "fail" for row in rows), "rows": rows}
+
+
+def format_comparison(result):
+    lines = [f"Нормалізація на швидкість машини: x{result['scale']}"]
+    lines.append(f"{'Метрика':<36}{'База':>14}{'Зараз':>14}{'Зміна':>10}{'Допуск':>9}  Статус")
+    for row in result["rows"]:
+        delta = "" if row["delta_pct"] is None else f"{row['delta_pct']:+.1f}%"
+        tolerance = f"{row['tolerance_pct']:.0f}%" if "tolerance_pct" in row else ""
+        base = "" if row["baseline"] is None else f"{row['baseline']:.6g}"
+        current = "" if row["current"] is None else f"{row['current']:.6g}"
+        lines.append(f"{row['metric']:<36}{base:>14}{current:>14}{delta:>10}{tolerance:>9}  {row['status'].upper()}")
+    lines.append("\nРегресій не виявлено." if result["passed"] else "\nВИЯВЛЕНО РЕГРЕСІЮ ПРОДУКТИВНОСТІ.")
+    return "\n".join(lines)
+
+
+def write_baseline(filename, meta, metrics, calibration, dataset=DATASET, tolerances=TOLERANCES):
+    baseline = {
+        "meta": dict(meta, calibration_s=round(calibration, 6)),
+        "dataset": dataset,
+        "tolerances": tolerances,
+        "metrics": metrics,
+    }
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Перевірка продуктивності проти збереженої бази")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="файл бази з результатами і допусками")
+    parser.add_argument("--update", action="store_true", help="переписати базу поточними результатами")
+    parser.add_argument("--tolerance", type=float, help="допуск для всіх часових метрик, частка (0.3 = 30%%)")
+    parser.add_argument("--no-normalize", action="store_true", help="не поправляти час на швидкість машини")
+    parser.add_argument("--json", action="store_true", help="вивести звіт у форматі JSON")
+    return parser
+
+
+def main(argv=None):
+    options = build_parser().parse_args(argv)
+    if options.update:
+        calibration = calibrate()
+        meta, metrics = collect()
+        write_baseline(options.baseline, meta, metrics, calibration)
+        print(f"Базу {options.baseline} оновлено ({len(metrics)} метрик).")
+        return 0
+
+    try:
+        with open(options.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        print(f"Файл бази {options.baseline} не знайдено. Створіть його з --update.", file=sys.stderr)
+        return 2
+    # Порівнюються лише результати на тому самому наборі даних, що й у базі
+    calibration = calibrate()
+    meta, metrics = collect(baseline.get("dataset", DATASET))
+    tolerances = dict(baseline.get("tolerances", {}))
+    if options.tolerance is not None:
+        tolerances["default"] = options.tolerance
+    result = compare(baseline, metrics, None if options.no_normalize else calibration, tolerances)
+    print(json.dumps(result, ensure_ascii=False, indent=2) if options.json else format_comparison(result))
+    return 0 if result["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
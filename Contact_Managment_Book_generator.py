@@ -0,0 +1,122 @@
+import argparse
+import json
+import random
+import sys
+
+FIRST_NAMES = [
+    "Олена", "Андрій", "Марія", "Олександр", "Ірина", "Дмитро", "Наталія", "Сергій", "Юлія", "Максим",
+    "Оксана", "Іван", "Тетяна", "Богдан", "Світлана", "Тарас", "Анна", "Василь", "Катерина", "Роман",
+    "Anna", "John", "Maria", "David", "Emma", "Michael", "Sophia", "James", "Olivia", "Daniel",
+    "Lucas", "Mia", "Noah", "Chloe", "Adam", "Eva", "Mark", "Lena", "Victor", "Nina",
+]
+LAST_NAMES = [
+    "Коваленко", "Шевченко", "Бондаренко", "Ткаченко", "Кравченко", "Олійник", "Мельник", "Бойко", "Руденко", "Савченко",
+    "Петренко", "Литвиненко", "Мороз", "Лисенко", "Марченко", "Поліщук", "Гнатюк", "Іваненко", "Кузьменко", "Павленко",
+    "Smith", "Johnson", "Brown", "Miller", "Davis", "Garcia", "Wilson", "Taylor", "Moore", "Clark",
+    "Lewis", "Walker", "Hall", "Young", "King", "Wright", "Scott", "Green", "Baker", "Adams",
+]
+OPERATOR_CODES = ["050", "063", "066", "067", "068", "073", "093", "095", "096", "097", "098", "099"]
+EMAIL_DOMAINS = ["gmail.com", "ukr.net", "i.ua", "outlook.com", "meta.ua", "proton.me"]
+CITIES = ["Київ", "Львів", "Одеса", "Харків", "Дніпро", "Вінниця", "Полтава", "Чернігів", "Ужгород", "Житомир"]
+STREETS = ["Шевченка", "Франка", "Грушевського", "Лесі Українки", "Хмельницького", "Сагайдачного", "Соборна", "Садова"]
+HASHTAGS = [
+    "#друзі", "#робота", "#родина", "#travel", "#music", "#movies", "#спорт", "#навчання", "#сусіди", "#лікар",
+    "#superhero", "#acting", "#книги", "#бізнес", "#фото", "#football", "#кулінарія", "#подорожі", "#it", "#волонтери",
+]
+NOTION_TEXTS = [
+    "Зателефонувати після обіду", "Привітати з днем народження", "Познайомились на конференції", "Позичив книгу",
+    "Met at the concert", "Call back next week", "Колега з попередньої роботи", "Домовились про зустріч",
+    "Old school friend", "Рекомендував лікаря",
+]
+
+# Транслітерація для адрес електронної пошти: шаблон пошти приймає лише латиницю
+TRANSLIT = str.maketrans({
+    "а": "a", "б": "b", "в": "v", "г": "h", "ґ": "g", "д": "d", "е": "e", "є": "ie", "ж": "zh", "з": "z",
+    "и": "y", "і": "i", "ї": "i", "й": "i", "к": "k", "л": "l", "м": "m", "н": "n", "о": "o", "п": "p",
+    "р": "r", "с": "s", "т": "t", "у": "u", "ф": "f", "х": "kh", "ц": "ts", "ч": "ch", "ш": "sh", "щ": "shch",
+    "ь": "", "ю": "iu", "я": "ia", "'": "",
+})
+
+
+def hashtag_weights(count, skew=1.2):
+    # Розподіл Ципфа: кілька популярних хештегів трапляються набагато частіше за решту
+    return [1 / (rank + 1) ** skew for rank in range(count)]
+
+
+def make_name(index):
+    # Унікальні імена: спершу всі пари ім'я-прізвище, далі прізвища з номером
+    first = FIRST_NAMES[index % len(FIRST_NAMES)]
+    round_number, position = divmod(index // len(FIRST_NAMES), len(LAST_NAMES))
+    last = LAST_NAMES[position]
+    if round_number:
+        last = f"{last}-{round_number}"
+    return f"{first} {last}"
+
+
+def make_birthday(rng):
+    if rng.random() < 0.01:
+        # 29 лютого - лише у високосні роки, решта коду має пережити такі дати
+        year = rng.choice([year for year in range(1944, 2009, 4)])
+        return f"29.02.{year}"
+    year = rng.randint(1940, 2010)
+    month = rng.randint(1, 12)
+    day = rng.randint(1, 28 if month == 2 else 30 if month in (4, 6, 9, 11) else 31)
+    return f"{day:02d}.{month:02d}.{year}"
+
+
+def generate_contacts(count, seed=0):
+    # Записи віддаються по одному у форматі файлу книги, тож мільйони контактів не тримаються в пам'яті
+    rng = random.Random(seed)
+    weights = hashtag_weights(len(HASHTAGS))
+    for index in range(count):
+        name = make_name(index)
+        contact = {
+            "name": name,
+            "phones": [rng.choice(OPERATOR_CODES) + f"{rng.randrange(10 ** 7):07d}" for _ in range(rng.choice((1, 1, 1, 2, 2, 3)))],
+            "email": None,
+            "birthday": None,
+            "notions": [],
+            "addresses": [],
+        }
+        if rng.random() < 0.8:
+            login = name.lower().translate(TRANSLIT).replace(" ", ".").replace("-", "")
+            contact["email"] = f"{login}{index}@{rng.choice(EMAIL_DOMAINS)}"
+        if rng.random() < 0.7:
+            contact["birthday"] = make_birthday(rng)
+        for _ in range(rng.choice((0, 0, 1, 1, 1, 2, 3))):
+            hashtags = sorted(set(rng.choices(HASHTAGS, weights, k=rng.randint(1, 3))))
+            contact["notions"].append({"text": rng.choice(NOTION_TEXTS), "hashtags": hashtags})
+        if rng.random() < 0.6:
+            contact["addresses"] = [f"м. {rng.choice(CITIES)}, вул. {rng.choice(STREETS)}, {rng.randint(1, 150)}"]
+        yield contact
+
+
+def write_contacts(out, count, seed=0):
+    # JSON-масив пишеться потоково, запис за записом
+    out.write("[")
+    for index, contact in enumerate(generate_contacts(count, seed)):
+        out.write(",\n" if index else "\n")
+        out.write(json.dumps(contact, ensure_ascii=False))
+    out.write("\n]\n")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Генератор синтетичних контактів для тестів і бенчмарків")
+    parser.add_argument("count", type=int, help="кількість контактів")
+    parser.add_argument("--seed", type=int, default=0, help="зерно генератора; однакове зерно дає однаковий файл")
+    parser.add_argument("--output", default="-", help="файл для запису ('-' для stdout)")
+    return parser
+
+
+def main(argv=None):
+    options = build_parser().parse_args(argv)
+    if options.output == "-":
+        write_contacts(sys.stdout, options.count, options.seed)
+    else:
+        with open(options.output, "w", encoding="utf-8") as out:
+            write_contacts(out, options.count, options.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,505 @@
+import argparse
+import tkinter as tk
+from tkinter import scrolledtext, filedialog, ttk, StringVar
+
+from Contact_Managment_Book_batch import BatchSession, execute, parse_line
+from Contact_Managment_Book_core import AddressBook, Record, format_birthdays
+from Contact_Managment_Book_profiling import add_profile_arguments, profiling
+from Contact_Managment_Book_v2 import registry
+from Contact_Managment_Book_worker import Cancelled, TaskRunner
+
+
+# Колонки списку контактів: заголовок і функція, що дістає значення із запису
+CONTACT_COLUMNS = {
+    "name": ("Ім'я", lambda record: record.original_name),
+    "phones": ("Телефони", lambda record: ", ".join(str(phone) for phone in record.phones)),
+    "email": ("Електронна пошта", lambda record: record.show_email()),
+    "birthday": ("День народження", lambda record: record.show_birthday()),
+    "address": ("Адреса", lambda record: ", ".join(record.address.addresses) if record.address else ""),
+    "notions": ("Нотатки", lambda record: "; ".join(notion.text for notion in record.notions)),
+}
+
+
+class VirtualList:
+    # Treeview тримає лише видимі рядки та невеликий запас; решта книги береться з
+    # відсортованого індексу імен у момент прокрутки
+    buffer = 5
+
+    def __init__(self, master, book, columns=("name", "phones"), height=25, on_select=None):
+        self.book = book
+        self.columns = columns
+        self.on_select = on_select
+        self.offset = 0
+        self.visible = height
+
+        self.frame = tk.Frame(master)
+        self.tree = ttk.Treeview(self.frame, columns=columns, show='headings', height=height, selectmode='browse')
+        for column in columns:
+            self.tree.heading(column, text=CONTACT_COLUMNS[column][0])
+        self.scrollbar = ttk.Scrollbar(self.frame, orient='vertical', command=self.scroll)
+        self.tree.grid(row=0, column=0, sticky='nsew')
+        self.scrollbar.grid(row=0, column=1, sticky='ns')
+        self.frame.rowconfigure(0, weight=1)
+        self.frame.columnconfigure(0, weight=1)
+
+        self.tree.bind("<Configure>", self.resize)
+        self.tree.bind("<MouseWheel>", self.wheel)
+        self.tree.bind("<Button-4>", lambda event: self.scroll('scroll', -3, 'units'))
+        self.tree.bind("<Button-5>", lambda event: self.scroll('scroll', 3, 'units'))
+        self.tree.bind("<Prior>", lambda event: self.scroll('scroll', -1, 'pages'))
+        self.tree.bind("<Next>", lambda event: self.scroll('scroll', 1, 'pages'))
+        self.tree.bind("<Home>", lambda event: self.move_to(0))
+        self.tree.bind("<End>", lambda event: self.move_to(len(self.book.names)))
+        self.tree.bind("<Double-1>", self.select)
+        self.tree.bind("<Return>", self.select)
+
+    def grid(self, **kwargs):
+        self.frame.grid(**kwargs)
+
+    def scroll(self, action, amount, unit=None):
+        # Той самий протокол, що й у Scrollbar: ('moveto', частка) або ('scroll', кількість, одиниці)
+        if action == 'moveto':
+            self.move_to(int(float(amount) * len(self.book.names)))
+        elif action == 'scroll':
+            step = self.visible if unit == 'pages' else 1
+            self.move_to(self.offset + int(amount) * step)
+
+    def wheel(self, event):
+        # Windows повертає кратні 120, macOS - дрібні значення
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self.scroll('scroll', -3 * delta, 'units')
+
+    def resize(self, event):
+        row_height = ttk.Style().lookup('Treeview', 'rowheight') or 20
+        visible = max(int(event.height) // int(row_height) - 1, 1)
+        if visible != self.visible:
+            self.visible = visible
+            self.refresh()
+
+    def move_to(self, offset):
+        total = len(self.book.names)
+        offset = max(0, min(offset, total - self.visible))
+        if offset != self.offset:
+            self.offset = offset
+            self.refresh()
+
+    def jump(self, prefix):
+        self.move_to(self.book.names.position(prefix.lower()))
+
+    def refresh(self):
+        names = self.book.names
+        total = len(names)
+        self.offset = max(0, min(self.offset, total - self.visible))
+        keys = names.page(self.offset, self.visible + self.buffer)
+        items = self.tree.get_children()
+
+        # Наявні рядки перевикористовуються, щоб Tk не створював віджети під час кожної прокрутки
+        for position, key in enumerate(keys):
+            record = self.book.data.get(key)
+            values = [CONTACT_COLUMNS[column][1](record) if record else "" for column in self.columns]
+            if position < len(items):
+                self.tree.item(items[position], values=values, tags=(key,))
+            else:
+                self.tree.insert('', tk.END, values=values, tags=(key,))
+        if len(items) > len(keys):
+            self.tree.delete(*items[len(keys):])
+
+        if total:
+            self.scrollbar.set(self.offset / total, min((self.offset + self.visible) / total, 1.0))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def select(self, event=None):
+        item = self.tree.focus()
+        if not item or self.on_select is None:
+            return
+        tags = self.tree.item(item, 'tags')
+        record = self.book.data.get(tags[0]) if tags else None
+        if record is not None:
+            self.on_select(record)
+
+
+class ConsoleSession(BatchSession):
+    # Вивід команди одразу відправляється у вікно, а не збирається до її завершення
+    def __init__(self, book, registry, task):
+        super().__init__(book, registry)
+        self.task = task
+
+    def emit(self, text):
+        self.task.post(text)
+
+
+class GUI:
+    # Пауза у введенні (мс), після якої запускається пошук
+    search_delay = 150
+
+    def __init__(self, master, address_book):
+        self.master = master
+        self.book = address_book  # Зберігаємо об’єкт book в атрибуті копії класу
+        master.title("BotLY")
+
+        # self.console_output = scrolledtext.ScrolledText(master, width=180, height=20)
+        # self.console_output.pack()
+        master.title("Console Interface")
+         # Підготовка відступу до елементів інтерфейсу
+        padx_val = 5
+        pady_val = 5
+
+        # Створення фрейму для розміщення вхідних полів
+        # input_frame = tk.Frame(master)
+        # input_frame.pack(side='left', padx=padx_val, pady=pady_val)
+
+
+        # Пошук під час введення за ім'ям, фрагментом телефону, поштою або #хештегом
+        search_frame = tk.Frame(master)
+        search_frame.grid(row=0, column=1, columnspan=3, padx=padx_val, pady=pady_val, sticky='we')
+        tk.Label(search_frame, text="Пошук:").grid(row=0, column=0, sticky='w')
+        self.search_var = StringVar()
+        self.search_entry = tk.Entry(search_frame, width=60, textvariable=self.search_var)
+        self.search_entry.grid(row=0, column=1, padx=padx_val, sticky='w')
+        self.search_status = StringVar()
+        tk.Label(search_frame, textvariable=self.search_status, anchor='w').grid(row=0, column=2, padx=padx_val, sticky='w')
+        self.search_results = ttk.Treeview(search_frame, columns=("name", "phones", "email"), show='headings', height=6)
+        for column in ("name", "phones", "email"):
+            self.search_results.heading(column, text=CONTACT_COLUMNS[column][0])
+        self.search_results.grid(row=1, column=0, columnspan=3, pady=pady_val, sticky='we')
+        self.search_results.bind("<Double-1>", self.show_search_record)
+        self.search_records = {}
+        self.search_job = None
+        self.search_var.trace_add('write', self.schedule_search)
+
+        self.command_entry = tk.Entry(master, width=130)
+        self.command_entry.grid(row=1, column=1, padx=padx_val, pady=pady_val, sticky='w')
+        self.command_entry.bind('<Return>', self.execute_command)  # Прив'язування події до кнопки Enter
+
+        # Створення кнопки для надсилання команди
+        self.send_button = tk.Button(master, text="Отправить", command=self.execute_command)
+        self.send_button.grid(row=1, column=2, padx=padx_val, pady=pady_val, sticky='w')
+
+        # Створення поля виводу результатів виконання команд
+        self.console_output = scrolledtext.ScrolledText(master, width=170, height=20)
+        self.console_output.grid(row=2, column=1, columnspan=3, padx=padx_val, pady=pady_val)
+
+        self.birthdays_button = tk.Button(master, text="Показати майбутні дні народження", command=self.birthdays)
+        self.birthdays_button.grid(row=3, column=2, padx=padx_val, pady=pady_val, sticky='w')
+
+
+
+        # Створення фрейму для розміщення вхідних полів
+        input_frame = tk.Frame(master)
+        input_frame.grid(row=3, column=1, padx=padx_val, pady=pady_val, sticky='w')
+
+        # Створення поля введення для імені з підказкою
+        self.name_var = StringVar()
+        self.name_var.set("введіть Ім'я")
+        self.name_entry = tk.Entry(input_frame, width=50, textvariable=self.name_var, fg='grey')
+        self.name_entry.grid(row=1, column=1, padx=padx_val, pady=pady_val, sticky='ew')  # sticky='ew' горизонтальне розтягування
+        self.name_entry.bind("<FocusIn>", self.clear_name_placeholder)  # Видалення підказки при фокусі
+        self.name_entry.bind("<FocusOut>", self.check_name_placeholder)  # Відновлення підказки при втраті фокуса
+
+        # Створення поля введення для номера телефону з підказкою
+        self.phone_var = StringVar()
+        self.phone_var.set("введіть номер телефону")  # Початкова підказка для телефону
+        self.phone_entry = tk.Entry(input_frame, width=50, textvariable=self.phone_var, fg='grey')
+        self.phone_entry.grid(row=2, column=1, padx=padx_val, pady=pady_val, sticky='ew')  # sticky='ew' горизонтальне розтягування
+        self.phone_entry.bind("<FocusIn>", self.clear_phone_placeholder)  # Видалення підказки при фокусі
+        self.phone_entry.bind("<FocusOut>", self.check_phone_placeholder)  # Відновлення підказки при втраті фокуса
+
+        # Створення кнопки для додавання контакту
+        self.add_button = tk.Button(input_frame, text="   Записати Контакт   ", command=self.add_record)
+        self.add_button.grid(row=3, column=1, padx=padx_val, pady=pady_val, sticky='ew')  # sticky='ew' горизонтальне розтягування
+
+        self.save_button = tk.Button(master, text="Зберегти нові записи в файл", command=self.save_to_file)
+        self.save_button.grid(row=4, column=1, padx=padx_val, pady=pady_val, sticky='w' )  # 'w' для вирівнювання на лівому краю
+
+        # Створення кнопки для завантаження з файлу
+        self.load_button = tk.Button(master, text="Завантажити данні з файлу    ", command=self.load_from_file)
+        self.load_button.grid(row=5, column=1, padx=padx_val, pady=pady_val, sticky='w' )  # 'w' для вирівнювання на лівому краю
+
+
+
+
+
+        # Створення кнопки для відображення всіх контактів
+        self.all_button = tk.Button(master, text="Показати Всі Контакти", command=self.display_all_contacts)
+        self.all_button.grid(row=3, column=3, padx=padx_val, pady=pady_val)
+
+        # Створення кнопки для відображення всієї інформації
+        self.display_button = tk.Button(master, text="Показати всю Інформацію", command=self.display_all)
+        self.display_button.grid(row=4, column=3, padx=padx_val, pady=pady_val)
+
+        # Індикатор завантаження книги під час старту
+        self.status_var = StringVar()
+        self.status_label = tk.Label(master, textvariable=self.status_var, anchor='w')
+        self.status_label.grid(row=6, column=1, padx=padx_val, pady=pady_val, sticky='w')
+        self.progress = ttk.Progressbar(master, length=300, mode='determinate', maximum=100)
+        self.progress.grid(row=6, column=2, columnspan=2, padx=padx_val, pady=pady_val, sticky='w')
+
+        # Кнопка для скасування довгої операції у фоновому потоці
+        self.cancel_button = tk.Button(master, text="Скасувати", command=self.cancel_tasks, state='disabled')
+        self.cancel_button.grid(row=5, column=3, padx=padx_val, pady=pady_val)
+
+        # Завантаження, збереження і пошук виконуються у фоні, щоб вікно не зависало
+        self.tasks = TaskRunner(master)
+        # Пошук має окремий потік, щоб не чекати на довге завантаження чи збереження
+        self.search_tasks = TaskRunner(master, poll_interval=20)
+        self.contact_lists = []
+        self.book_ready = True
+        master.protocol("WM_DELETE_WINDOW", self.close)
+
+    def run_in_background(self, title, function, on_done, on_message=None, on_failed=None):
+        self.status_var.set(f"{title}...")
+        self.progress['value'] = 0
+        self.cancel_button.config(state='normal')
+
+        def finished(result):
+            self.task_finished(f"{title}: готово")
+            on_done(result)
+
+        def failed(error):
+            self.task_finished(f"{title}: помилка")
+            self.console_output.insert(tk.END, f"Помилка: {error}\n")
+            if on_failed is not None:
+                on_failed()
+
+        def cancelled():
+            self.task_finished(f"{title}: скасовано")
+            if on_failed is not None:
+                on_failed()
+
+        return self.tasks.submit(title, function, on_done=finished, on_error=failed,
+                                 on_progress=self.show_progress, on_cancel=cancelled, on_message=on_message)
+
+    def task_finished(self, status):
+        self.status_var.set(status)
+        self.progress['value'] = 100
+        if not self.tasks.busy:
+            self.cancel_button.config(state='disabled')
+
+    def cancel_tasks(self):
+        self.tasks.cancel_all()
+
+    def close(self):
+        self.tasks.shutdown()
+        self.search_tasks.shutdown()
+        self.master.destroy()
+
+    def open_book(self):
+        # Вікно вже показане, тож книга завантажується вже після першого відмальовування
+        if self.book.loaded:
+            return
+        self.set_book_ready(False)
+        self.run_in_background(f"Завантаження {self.book.filename}",
+                               lambda task: self.book.open(progress=task.report),
+                               self.book_opened, on_failed=lambda: self.set_book_ready(True))
+
+    def book_opened(self, book):
+        self.set_book_ready(True)
+        self.status_var.set(f"Завантажено контактів: {len(book)}")
+        self.refresh_contacts()
+
+    def set_book_ready(self, ready):
+        # Поки книга завантажується, додавання, збереження і команди вимкнені: збереження записало б
+        # порожню книгу поверх файлу, а доданий контакт зник би, коли завантаження підставить свої записи
+        self.book_ready = ready
+        state = 'normal' if ready else 'disabled'
+        for widget in (self.add_button, self.save_button, self.send_button, self.command_entry):
+            widget.config(state=state)
+
+    def schedule_search(self, *args):
+        # Запит відправляється лише після паузи у введенні
+        if self.search_job is not None:
+            self.master.after_cancel(self.search_job)
+        self.search_job = self.master.after(self.search_delay, self.start_search)
+
+    def start_search(self):
+        self.search_job = None
+        query = self.search_var.get()
+        # Попередні запити вже неактуальні: їхні результати будуть відкинуті
+        self.search_tasks.cancel_all()
+        if not query.strip():
+            self.show_search_results(query, [])
+            return
+        self.search_tasks.submit("Пошук", lambda task: self.find_records(task, query),
+                                 on_done=lambda records: self.show_search_results(query, records),
+                                 on_error=lambda error: self.search_status.set(f"Помилка пошуку: {error}"))
+
+    def find_records(self, task, query):
+        # Запит, що встиг застаріти в черзі, навіть не починається
+        if task.cancelled:
+            raise Cancelled(task.name)
+        return self.book.search(query)
+
+    def show_search_results(self, query, records):
+        self.search_results.delete(*self.search_results.get_children())
+        self.search_records = {}
+        for record in records:
+            item = self.search_results.insert('', tk.END, values=[CONTACT_COLUMNS[column][1](record) for column in ("name", "phones", "email")])
+            self.search_records[item] = record
+        self.search_status.set(f"Знайдено: {len(records)}" if query.strip() else "")
+
+    def show_search_record(self, event=None):
+        record = self.search_records.get(self.search_results.focus())
+        if record is not None:
+            self.show_record(record)
+
+    def show_progress(self, done, total):
+        self.progress['value'] = 100 * done / total if total else 100
+
+    def birthdays(self):
+        records = self.book.consistent_view().values()
+        self.run_in_background("Пошук днів народження", lambda task: format_birthdays(self.book.birthdays_by_day(records)), self.show_birthdays_text)
+
+    def show_birthdays_text(self, output):
+        # Очищуємо текстове поле перед виводом інформації
+        self.console_output.delete(1.0, tk.END)
+        # Вставляємо результат у текстове поле
+        self.console_output.insert(tk.END, output)
+
+    def execute_command(self, event=None):
+        line = self.command_entry.get().strip()  # Отримуємо текст із поля введення
+        if not line or not self.book_ready:
+            return
+        self.command_entry.delete(0, tk.END)
+        self.console_output.insert(tk.END, f"> {line}\n")
+        # Команда виконується тим самим реєстром, що й у консолі, над уже завантаженою книгою
+        self.run_in_background(f"Команда {line.split()[0]}", lambda task: self.run_command(task, line),
+                               self.command_finished, on_message=self.show_message)
+
+    def run_command(self, task, line):
+        words = parse_line(line)
+        return execute(ConsoleSession(self.book, registry, task), words[0], words[1:])
+
+    def show_message(self, text):
+        self.console_output.insert(tk.END, f"{text}\n")
+        self.console_output.see(tk.END)
+
+    def command_finished(self, result):
+        # Повідомлення, надруковані моделями напряму, приходять разом із результатом
+        for text in result.get("output", []):
+            self.show_message(text)
+        if "error" in result:
+            self.show_message(result["error"])
+            if result["command"] not in registry.commands:
+                self.show_message(registry.suggest(result["command"]))
+        if result["ok"]:
+            self.refresh_contacts()
+
+    def clear_name_placeholder(self, event):
+        if self.name_var.get() == "введіть Ім'я":
+            self.name_var.set('')
+            self.name_entry.config(fg='black')  # Зміна кольору тексту при видаленні підказки
+
+    def check_name_placeholder(self, event):
+        if not self.name_var.get():
+            self.name_var.set("введіть Ім'я")
+            self.name_entry.config(fg='grey')  # Зміна кольору тексту при відновленні підказки
+
+    def clear_phone_placeholder(self, event):
+        if self.phone_var.get() == "введіть номер телефону":
+            self.phone_var.set('')
+            self.phone_entry.config(fg='black')  # Зміна кольору тексту при видаленні підказки
+
+    def check_phone_placeholder(self, event):
+        if not self.phone_var.get():
+            self.phone_var.set("введіть номер телефону")
+            self.phone_entry.config(fg='grey')  # Зміна кольору тексту при відновленні підказки
+
+    def add_record(self):
+        if not self.book_ready:
+            return
+        name = self.name_entry.get().strip()
+        phone = self.phone_entry.get().strip()
+        if name and phone:
+            record = Record(name)
+            record.add_phone(phone)
+            self.book.add_record(record)
+            self.console_output.insert(tk.END, f"Додано: {record}\n")
+            self.refresh_contacts()
+            self.name_entry.delete(0, tk.END)
+            self.phone_entry.delete(0, tk.END)
+        else:
+            self.console_output.insert(tk.END, "Будь ласка, введіть і ім'я, і телефон!\n")
+
+
+    def display_all_contacts(self):
+        self.show_contacts("Всі контакти", ("name", "phones"))
+
+    def display_all(self):
+        self.show_contacts("Вся інформація", tuple(CONTACT_COLUMNS))
+
+    def show_contacts(self, title, columns):
+        # Список відкривається в окремому вікні, щоб не засмічувати поле виводу тисячами рядків
+        window = tk.Toplevel(self.master)
+        window.title(f"{title} ({len(self.book.names)})")
+        window.rowconfigure(1, weight=1)
+        window.columnconfigure(0, weight=1)
+
+        contacts = VirtualList(window, self.book, columns, on_select=self.show_record)
+        contacts.grid(row=1, column=0, sticky='nsew', padx=5, pady=5)
+
+        # Поле для швидкого переходу до контакту за першими літерами імені
+        jump_var = StringVar()
+        jump_entry = tk.Entry(window, textvariable=jump_var, width=40)
+        jump_entry.grid(row=0, column=0, padx=5, pady=5, sticky='w')
+        jump_var.trace_add('write', lambda *args: contacts.jump(jump_var.get()))
+
+        contacts.refresh()
+        contacts.tree.focus_set()
+        self.contact_lists.append(contacts)
+        window.bind("<Destroy>", lambda event: event.widget is window and self.contact_lists.remove(contacts))
+        return contacts
+
+    def show_record(self, record):
+        self.console_output.insert(tk.END, f"{record}\n")
+        self.console_output.see(tk.END) # Прокручуємо текст вниз
+
+    def refresh_contacts(self):
+        for contacts in self.contact_lists:
+            contacts.refresh()
+
+    def save_to_file(self):
+        if not self.book_ready:
+            return
+        filename = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON Files", "*.json")])
+        if filename:
+            # Знімок береться в потоці Tk, тож зміни під час запису не потрапляють у файл наполовину
+            records = self.book.consistent_view().values()
+            self.run_in_background("Збереження", lambda task: self.book.save_to_json(filename, records),
+                                   lambda result: self.console_output.insert(tk.END, f"{result}\n"))
+
+    def load_from_file(self):
+        filename = filedialog.askopenfilename(filetypes=[("JSON Files", "*.json")])
+        if filename:
+            self.run_in_background("Завантаження", lambda task: self.book.load_from_json(filename, progress=task.report),
+                                   lambda report: self.file_loaded(filename))
+
+    def file_loaded(self, filename):
+        self.console_output.insert(tk.END, f"Завантажено дані з файлу: {filename}\n")
+        self.refresh_contacts()
+
+
+def run_gui():
+    # Створюємо об’єкт AddressBook та вікно Tkinter
+    # Книгою одночасно користуються потік Tk і фонові задачі
+    book = AddressBook(lazy=True, thread_safe=True)
+    root = tk.Tk()
+    gui = GUI(root, book)  # Використовуємо об'єкт book для передачі в GUI
+    root.after(0, gui.open_book)
+    root.mainloop()
+    return gui
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Графічний інтерфейс книги контактів")
+    add_profile_arguments(parser)
+    options = parser.parse_args(argv)
+    if options.profile:
+        with profiling(options.profile, options.profile_output, options.profile_interval):
+            run_gui()
+    else:
+        run_gui()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+import bisect
+
+# Більші пакети зливаються одним сортуванням або фільтром замість вставок по одному
+BULK_THRESHOLD = 64
+
+
+class NameIndex:
+    # Відсортовані ключі контактів: сторінку зі списку можна взяти зрізом, не сортуючи всю книгу
+    def __init__(self, keys=()):
+        self.keys = sorted(keys)
+
+    def add(self, key):
+        position = bisect.bisect_left(self.keys, key)
+        if position == len(self.keys) or self.keys[position] != key:
+            self.keys.insert(position, key)
+
+    def remove(self, key):
+        position = bisect.bisect_left(self.keys, key)
+        if position < len(self.keys) and self.keys[position] == key:
+            del self.keys[position]
+
+    def add_many(self, keys):
+        keys = set(keys)
+        if len(keys) < BULK_THRESHOLD:
+            for key in keys:
+                self.add(key)
+        else:
+            self.keys = sorted(keys.union(self.keys))
+
+    def remove_many(self, keys):
+        keys = set(keys)
+        if len(keys) < BULK_THRESHOLD:
+            for key in keys:
+                self.remove(key)
+        else:
+            self.keys = [key for key in self.keys if key not in keys]
+
+    def position(self, prefix):
+        # Позиція першого ключа, не меншого за prefix, для переходу до потрібної літери
+        return bisect.bisect_left(self.keys, prefix)
+
+    def page(self, start, count):
+        return self.keys[start:start + count]
+
+    def __contains__(self, key):
+        position = bisect.bisect_left(self.keys, key)
+        return position < len(self.keys) and self.keys[position] == key
+
+    def __getitem__(self, item):
+        return self.keys[item]
+
+    def __iter__(self):
+        return iter(self.keys)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def state(self):
+        return self.keys
+
+    @classmethod
+    def from_state(cls, keys):
+        index = cls()
+        index.keys = list(keys)
+        return index
+
+
+def record_terms(record):
+    # Усе, за чим контакт можна знайти: слова імені, телефони, пошта і хештеги
+    words = tuple(sorted(set(record.original_name.lower().split())))
+    phones = tuple(sorted({str(phone) for phone in record.phones}))
+    email = record.email.value.lower() if record.email else None
+    hashtags = tuple(sorted({hashtag.lower() for notion in record.notions for hashtag in notion.hashtags}))
+    return words, phones, email, hashtags
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def prefix_range(entries, prefix):
+    # entries - відсортований список пар (значення, ключ)
+    start = bisect.bisect_left(entries, (prefix,))
+    for position in range(start, len(entries)):
+        value, key = entries[position]
+        if not value.startswith(prefix):
+            break
+        yield key
+
+
+def insort_pair(entries, pair):
+    position = bisect.bisect_left(entries, pair)
+    if position == len(entries) or entries[position] != pair:
+        entries.insert(position, pair)
+
+
+def remove_pair(entries, pair):
+    position = bisect.bisect_left(entries, pair)
+    if position < len(entries) and entries[position] == pair:
+        del entries[position]
+
+
+class SearchIndex:
+    # Індекси для пошуку під час введення: префікси слів імені, пошти й хештегів
+    # через відсортовані списки, фрагменти телефонів через триграми
+    def __init__(self, records=None):
+        self.terms = {}
+        self.words = []
+        self.phones = []
+        self.emails = []
+        self.hashtags = []
+        self.phone_trigrams = {}
+        if records:
+            for key, record in records.items():
+                self._index(key, record_terms(record), sort=False)
+            self.words.sort()
+            self.phones.sort()
+            self.emails.sort()
+            self.hashtags.sort()
+
+    def _index(self, key, terms, sort=True):
+        add = insort_pair if sort else lambda entries, pair: entries.append(pair)
+        words, phones, email, hashtags = terms
+        self.terms[key] = terms
+        for word in words:
+            add(self.words, (word, key))
+        for phone in phones:
+            add(self.phones, (phone, key))
+            for trigram in trigrams(phone):
+                self.phone_trigrams.setdefault(trigram, set()).add(key)
+        if email:
+            add(self.emails, (email, key))
+        for hashtag in hashtags:
+            add(self.hashtags, (hashtag, key))
+
+    def add(self, key, record):
+        self.remove(key)
+        self._index(key, record_terms(record))
+
+    def add_many(self, items):
+        items = dict(items)
+        if len(items) < BULK_THRESHOLD:
+            for key, record in items.items():
+                self.add(key, record)
+            return
+        self.remove_many(items)
+        for key, record in items.items():
+            self._index(key, record_terms(record), sort=False)
+        # Timsort зливає вже відсортований список із дописаним хвостом майже за лінійний час
+        self.words.sort()
+        self.phones.sort()
+        self.emails.sort()
+        self.hashtags.sort()
+
+    def remove_many(self, keys):
+        keys = {key for key in keys if key in self.terms}
+        if len(keys) < BULK_THRESHOLD:
+            for key in keys:
+                self.remove(key)
+            return
+        for key in keys:
+            for phone in self.terms.pop(key)[1]:
+                for trigram in trigrams(phone):
+                    postings = self.phone_trigrams.get(trigram)
+                    if postings is not None:
+                        postings.discard(key)
+                        if not postings:
+                            del self.phone_trigrams[trigram]
+        self.words = [pair for pair in self.words if pair[1] not in keys]
+        self.phones = [pair for pair in self.phones if pair[1] not in keys]
+        self.emails = [pair for pair in self.emails if pair[1] not in keys]
+        self.hashtags = [pair for pair in self.hashtags if pair[1] not in keys]
+
+    def remove(self, key):
+        terms = self.terms.pop(key, None)
+        if terms is None:
+            return
+        words, phones, email, hashtags = terms
+        for word in words:
+            remove_pair(self.words, (word, key))
+        for phone in phones:
+            remove_pair(self.phones, (phone, key))
+            for trigram in trigrams(phone):
+                keys = self.phone_trigrams.get(trigram)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self.phone_trigrams[trigram]
+        if email:
+            remove_pair(self.emails, (email, key))
+        for hashtag in hashtags:
+            remove_pair(self.hashtags, (hashtag, key))
+
+    def find_names(self, query):
+        # Кожне слово запиту має бути початком одного зі слів імені
+        first, *rest = query.split()
+        for key in prefix_range(self.words, first):
+            terms = self.terms.get(key)
+            if terms and all(any(word.startswith(part) for word in terms[0]) for part in rest):
+                yield key
+
+    def find_phones(self, fragment):
+        if len(fragment) < 3:
+            yield from prefix_range(self.phones, fragment)
+            return
+        postings = [self.phone_trigrams.get(trigram, set()) for trigram in trigrams(fragment)]
+        postings.sort(key=len)
+        for key in set.intersection(*postings):
+            terms = self.terms.get(key)
+            if terms and any(fragment in phone for phone in terms[1]):
+                yield key
+
+    def find_emails(self, prefix):
+        return prefix_range(self.emails, prefix)
+
+    def find_hashtags(self, prefix):
+        return prefix_range(self.hashtags, prefix)
+
+    def search(self, query, limit=50):
+        query = query.strip().lower()
+        if not query:
+            return []
+        if query.startswith("#"):
+            sources = [self.find_hashtags(query)]
+        elif query.isdigit():
+            sources = [self.find_phones(query)]
+        elif "@" in query:
+            sources = [self.find_emails(query)]
+        else:
+            sources = [self.find_names(query), self.find_emails(query)]
+
+        found = []
+        seen = set()
+        for source in sources:
+            for key in source:
+                if key not in seen:
+                    seen.add(key)
+                    found.append(key)
+                    if len(found) >= limit:
+                        return sorted(found)
+        return sorted(found)
+
+    def __len__(self):
+        return len(self.terms)
+
+    def state(self):
+        # Лише вбудовані типи, які вміє marshal. Множини триграм пишуться кортежами:
+        # так їх запис і читання в кілька разів швидші
+        trigram_keys = {trigram: tuple(keys) for trigram, keys in self.phone_trigrams.items()}
+        return self.terms, self.words, self.phones, self.emails, self.hashtags, trigram_keys
+
+    @classmethod
+    def from_state(cls, state):
+        index = cls()
+        index.terms, index.words, index.phones, index.emails, index.hashtags, trigram_keys = state
+        index.phone_trigrams = {trigram: set(keys) for trigram, keys in trigram_keys.items()}
+        return index
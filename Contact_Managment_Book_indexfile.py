@@ -0,0 +1,87 @@
+import hashlib
+import json
+import marshal
+import mmap
+import os
+import struct
+
+from Contact_Managment_Book_index import NameIndex, SearchIndex
+
+# Файл індексів лежить поруч із файлом книги: сигнатура, довжина заголовка, заголовок у JSON
+# і розділи зі станом індексів у форматі marshal. Відбиток у заголовку лише відсіює застарілі файли
+# і не є захистом: хто може писати поруч із файлом книги, той обчислить відбиток сам, а marshal не
+# розрахований на навмисно підроблені дані. Тому файлу індексів довіряють рівно так само, як файлу
+# книги, а пошкоджений чи невідповідний розділ просто означає перебудову індексу
+MAGIC = b"CMBIDX01"
+HEADER_SIZE = struct.Struct("<I")
+# Змінюється разом зі структурою індексів або правилами record_terms: старі файли тоді просто не підходять
+FORMAT_VERSION = 1
+SECTIONS = {"names": NameIndex, "search": SearchIndex}
+
+
+def index_path(filename):
+    return f"{filename}.idx"
+
+
+def content_stamp(raw):
+    # Відбиток саме тих байтів, які лежать у файлі книги
+    return hashlib.sha256(raw).hexdigest()
+
+
+def write_index_file(filename, stamp, names, search=None):
+    # Індекс пошуку будується лише при першому пошуку, тож без нього файл містить тільки імена
+    indexes = {"names": names, "search": search}
+    sections = []
+    layout = {}
+    offset = 0
+    for name in SECTIONS:
+        if indexes[name] is None:
+            continue
+        body = marshal.dumps(indexes[name].state())
+        sections.append(body)
+        layout[name] = [offset, len(body)]
+        offset += len(body)
+    header = json.dumps({
+        "format": FORMAT_VERSION,
+        "marshal": marshal.version,
+        "stamp": stamp,
+        "records": len(names),
+        "sections": layout,
+    }).encode("utf-8")
+    path = index_path(filename)
+    # Запис через тимчасовий файл і перейменування: інший процес ніколи не читає файл наполовину
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(MAGIC + HEADER_SIZE.pack(len(header)) + header)
+        for body in sections:
+            f.write(body)
+    os.replace(temporary, path)
+    return path
+
+
+def read_header(mapped):
+    if mapped[:len(MAGIC)] != MAGIC:
+        return None, 0
+    start = len(MAGIC) + HEADER_SIZE.size
+    (size,) = HEADER_SIZE.unpack(mapped[len(MAGIC):start])
+    return json.loads(mapped[start:start + size]), start + size
+
+
+def read_index_file(filename, stamp, section):
+    # Файл відображається в пам'ять: перевіряється лише заголовок, а marshal читає потрібний
+    # розділ прямо зі сторінок файлу без окремої копії в байтовий рядок.
+    # Повертає індекс або None, якщо файлу немає, у ньому немає цього розділу, він пошкоджений
+    # чи зроблений для іншого вмісту книги
+    try:
+        with open(index_path(filename), "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            header, body = read_header(mapped)
+            if (header is None or header.get("format") != FORMAT_VERSION
+                    or header.get("marshal") != marshal.version or header.get("stamp") != stamp):
+                return None
+            offset, size = header["sections"][section]
+            with memoryview(mapped) as view, view[body + offset:body + offset + size] as part:
+                state = marshal.loads(part)
+        index = SECTIONS[section].from_state(state)
+    except (OSError, ValueError, EOFError, TypeError, KeyError, AttributeError, struct.error):
+        return None
+    return index if len(index) == header["records"] else None
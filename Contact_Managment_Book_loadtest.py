@@ -0,0 +1,134 @@
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+DEFAULT_PATHS = ["/health", "/contacts?limit=20", "/search?q=a", "/birthdays"]
+
+
+async def read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("Сервер закрив з'єднання.")
+    status = int(status_line.split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if headers.get("transfer-encoding") == "chunked":
+        body = b""
+        while True:
+            size = int((await reader.readline()).strip(), 16)
+            chunk = await reader.readexactly(size + 2)
+            if size == 0:
+                break
+            body += chunk[:-2]
+    else:
+        body = await reader.readexactly(int(headers.get("content-length", 0)))
+    return status, body
+
+
+async def client(host, port, paths, count, latencies, errors):
+    # Кожен клієнт тримає одне keep-alive з'єднання і надсилає запити послідовно
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for number in range(count):
+            path = paths[number % len(paths)]
+            started = time.perf_counter()
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("latin-1"))
+            status, _ = await read_response(reader)
+            latencies.append(time.perf_counter() - started)
+            if status >= 400:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, paths, clients, requests):
+    latencies = []
+    errors = []
+    per_client = max(requests // clients, 1)
+    started = time.perf_counter()
+    await asyncio.gather(*(client(host, port, paths, per_client, latencies, errors) for _ in range(clients)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+
+    def percentile(share):
+        return round(latencies[min(int(len(latencies) * share), len(latencies) - 1)] * 1000, 3)
+
+    return {
+        "requests": len(latencies),
+        "clients": clients,
+        "errors": len(errors),
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": percentile(0.50),
+        "p99_ms": percentile(0.99),
+    }
+
+
+def free_port():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def spawn_server(filename, port):
+    # Сервер запускається окремим процесом, щоб клієнти не ділили з ним одну петлю та GIL
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Contact_Managment_Book_api.py")
+    process = subprocess.Popen([sys.executable, script, "--file", filename, "--port", str(port), "--autosave", "0"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return process
+        except OSError:
+            if process.poll() is not None:
+                raise RuntimeError("Сервер API не запустився.")
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("Сервер API не відповів за 60 секунд.")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Навантажувальний тест HTTP API книги контактів")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="порт запущеного сервера")
+    parser.add_argument("--spawn", metavar="FILE", help="запустити сервер з цією книгою на вільному порту")
+    parser.add_argument("--clients", type=int, default=16, help="кількість одночасних з'єднань")
+    parser.add_argument("--requests", type=int, default=10000, help="загальна кількість запитів")
+    parser.add_argument("--path", action="append", help="шлях запиту (можна вказати кілька)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    options = parser.parse_args(argv)
+    if options.port is None and options.spawn is None:
+        parser.error("вкажіть --port запущеного сервера або --spawn FILE")
+
+    process = None
+    port = options.port
+    if options.spawn:
+        port = free_port()
+        process = spawn_server(options.spawn, port)
+    try:
+        result = asyncio.run(run_load(options.host, port, options.path or DEFAULT_PATHS, options.clients, options.requests))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    print(json.dumps(result, ensure_ascii=False))
+    return 1 if result["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
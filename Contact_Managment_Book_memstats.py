@@ -0,0 +1,196 @@
+import argparse
+import io
+import json
+import sys
+import threading
+import tracemalloc
+import types
+from contextlib import redirect_stdout
+
+from Contact_Managment_Book_core import AddressBook
+from Contact_Managment_Book_locks import NullLock, ReadWriteLock
+
+DEFAULT_FILES = ["contacts.json", "contacts_all.json", "contacts_book.json"]
+
+CATEGORIES = ["Record", "Name", "Phone", "Email", "Birthday", "Notion", "hashtags", "Address", "AddressBook.data", "caches", "indexes"]
+
+# Функції, методи, модулі й блокування спільні для всієї програми і не належать жодному контакту
+SHARED_TYPES = (type, types.FunctionType, types.BuiltinFunctionType, types.MethodType, types.ModuleType,
+                NullLock, ReadWriteLock, type(threading.Lock()), threading.Condition)
+
+
+def deep_size(obj, seen):
+    # Кожен об'єкт рахується лише раз: спільні рядки й поля, які знімок ділить з контактом,
+    # потрапляють у першу категорію, що до них дійшла
+    size = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if item is None or id(item) in seen or isinstance(item, SHARED_TYPES):
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif not isinstance(item, (str, bytes, int, float, bool)):
+            attributes = getattr(item, "__dict__", None)
+            if attributes is not None:
+                seen.add(id(attributes))
+                size += sys.getsizeof(attributes)
+                stack.extend(attributes.values())
+            for slot in getattr(type(item), "__slots__", ()):
+                stack.append(getattr(item, slot, None))
+    return size
+
+
+def shallow_size(obj, seen):
+    # Сам об'єкт і його словник атрибутів, без вкладених значень
+    if obj is None or id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    attributes = getattr(obj, "__dict__", None)
+    if attributes is not None and id(attributes) not in seen:
+        seen.add(id(attributes))
+        size += sys.getsizeof(attributes)
+    return size
+
+
+def model_sizes(book):
+    sizes = dict.fromkeys(CATEGORIES, 0)
+    counts = dict.fromkeys(CATEGORIES, 0)
+    seen = set()
+    with book.lock.read():
+        records = list(book.data.values())
+        sizes["AddressBook.data"] = sys.getsizeof(book.data) + sum(deep_size(key, seen) for key in book.data)
+        counts["AddressBook.data"] = 1
+        for record in records:
+            sizes["Name"] += deep_size(record.name, seen)
+            counts["Name"] += 1
+            for phone in record.phones:
+                sizes["Phone"] += deep_size(phone, seen)
+                counts["Phone"] += 1
+            for category, field in (("Email", record.email), ("Birthday", record.birthday), ("Address", record.address)):
+                if field is not None:
+                    sizes[category] += deep_size(field, seen)
+                    counts[category] += 1
+            for notion in record.notions:
+                sizes["hashtags"] += deep_size(notion.hashtags, seen)
+                counts["hashtags"] += 1
+                sizes["Notion"] += shallow_size(notion, seen) + deep_size(notion.text, seen)
+                counts["Notion"] += 1
+            sizes["Record"] += shallow_size(record, seen)
+            for value in (record.original_name, record.phones, record.notions, record.data):
+                sizes["Record"] += deep_size(value, seen)
+            counts["Record"] += 1
+            sizes["caches"] += deep_size(record._rendered, seen) + deep_size(record._frozen, seen)
+        for index in (book.names, book._search, book._versions):
+            if index is not None:
+                sizes["indexes"] += deep_size(index, seen)
+                counts["indexes"] += 1
+    return sizes, counts
+
+
+def top_sites(snapshot, limit=10):
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ])
+    sites = []
+    for stat in snapshot.statistics("lineno")[:limit]:
+        frame = stat.traceback[0]
+        sites.append({"site": f"{frame.filename}:{frame.lineno}", "bytes": stat.size, "blocks": stat.count})
+    return sites
+
+
+def memory_report(book, snapshot=None, top=10):
+    # Якщо tracemalloc увімкнено (наприклад, PYTHONTRACEMALLOC=1), до звіту додаються місця виділення пам'яті
+    if snapshot is None and tracemalloc.is_tracing():
+        snapshot = tracemalloc.take_snapshot()
+    sizes, counts = model_sizes(book)
+    contacts = len(book)
+    total = sum(sizes.values())
+    report = {
+        "contacts": contacts,
+        "total_bytes": total,
+        "per_contact_bytes": round(total / contacts, 1) if contacts else 0,
+        "categories": {
+            category: {
+                "bytes": sizes[category],
+                "objects": counts[category],
+                "per_contact_bytes": round(sizes[category] / contacts, 1) if contacts else 0,
+            }
+            for category in CATEGORIES
+        },
+    }
+    if snapshot is not None:
+        report["traced_bytes"] = sum(stat.size for stat in snapshot.statistics("filename"))
+        report["top_sites"] = top_sites(snapshot, top)
+    return report
+
+
+def trace_load(filename, top=10, trace=True):
+    # Завантаження під tracemalloc: видно, які рядки коду виділили пам'ять під книгу
+    if not trace:
+        with redirect_stdout(io.StringIO()):
+            return memory_report(AddressBook(filename), top=top)
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        with redirect_stdout(io.StringIO()):
+            book = AddressBook(filename)
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        if started:
+            tracemalloc.stop()
+    return memory_report(book, snapshot, top)
+
+
+def format_size(size):
+    for unit in ("Б", "КБ", "МБ"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "Б" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} ГБ"
+
+
+def format_report(report):
+    lines = [f"Контактів: {report['contacts']}, усього: {format_size(report['total_bytes'])}, "
+             f"на контакт: {format_size(report['per_contact_bytes'])}"]
+    lines.append("Категорія".ljust(20) + "Об'єктів".rjust(10) + "Розмір".rjust(14) + "На контакт".rjust(14))
+    for category, stats in report["categories"].items():
+        lines.append(f"{category:<20}{stats['objects']:>10}{format_size(stats['bytes']):>14}{format_size(stats['per_contact_bytes']):>14}")
+    if "top_sites" in report:
+        lines.append(f"\nВиділено під tracemalloc: {format_size(report['traced_bytes'])}. Найбільші місця виділення:")
+        for site in report["top_sites"]:
+            lines.append(f"  {format_size(site['bytes']):>10}  {site['blocks']:>8} блоків  {site['site']}")
+    return "\n".join(lines)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Звіт про пам'ять, яку займає книга контактів, для планування ресурсів")
+    parser.add_argument("files", nargs="*", default=DEFAULT_FILES, help="файли книг (типово всі три файли даних)")
+    parser.add_argument("--top", type=int, default=10, help="кількість найбільших місць виділення пам'яті")
+    parser.add_argument("--no-trace", action="store_true", help="без tracemalloc: швидше, але без місць виділення")
+    parser.add_argument("--json", action="store_true", help="вивести звіт у форматі JSON")
+    return parser
+
+
+def main(argv=None):
+    options = build_parser().parse_args(argv)
+    reports = {filename: trace_load(filename, options.top, not options.no_trace) for filename in options.files}
+    if options.json:
+        print(json.dumps(reports, ensure_ascii=False, indent=2))
+    else:
+        for filename, report in reports.items():
+            print(f"\n{filename}\n{format_report(report)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
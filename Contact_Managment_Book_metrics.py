@@ -0,0 +1,194 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Гістограма в стилі HDR: до 64 нс значення точні, далі кожен степінь двійки ділиться на 32
+# рівні частини, тож похибка перцентилів не перевищує ~3% на будь-якому масштабі
+SUB_BUCKET_BITS = 5
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+FAMILIES = {
+    "command": "Час виконання команд книги контактів у секундах.",
+    "storage": "Час завантаження і збереження файлу книги у секундах.",
+}
+
+
+def bucket_index(value):
+    shift = max(value.bit_length() - SUB_BUCKET_BITS - 1, 0)
+    return (shift << SUB_BUCKET_BITS) + (value >> shift)
+
+
+def bucket_bounds(index):
+    if index < 2 * SUB_BUCKETS:
+        return index, 1
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    return (index - (shift << SUB_BUCKET_BITS)) << shift, 1 << shift
+
+
+class LatencyHistogram:
+    # Значення зберігаються в наносекундах; рахуються лише непорожні кошики
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def record(self, nanoseconds):
+        nanoseconds = max(int(nanoseconds), 0)
+        index = bucket_index(nanoseconds)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += nanoseconds
+        if self.min is None or nanoseconds < self.min:
+            self.min = nanoseconds
+        if nanoseconds > self.max:
+            self.max = nanoseconds
+
+    def percentile(self, share):
+        if not self.count:
+            return 0
+        rank = max(int(self.count * share + 0.5), 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                lower, width = bucket_bounds(index)
+                return min(max(lower + width // 2, self.min), self.max)
+        return self.max
+
+    def copy(self):
+        clone = LatencyHistogram()
+        clone.buckets = dict(self.buckets)
+        clone.count, clone.total, clone.min, clone.max = self.count, self.total, self.min, self.max
+        return clone
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms = {}
+        self.errors = {}
+
+    def record(self, family, name, nanoseconds, failed=False):
+        key = (family, name)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram()
+                self.errors[key] = 0
+            histogram.record(nanoseconds)
+            if failed:
+                self.errors[key] += 1
+
+    @contextmanager
+    def timer(self, family, name):
+        started = time.perf_counter_ns()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            self.record(family, name, time.perf_counter_ns() - started, failed)
+
+    def snapshot(self):
+        # Копія під блокуванням: звіт не бачить запис, що змінюється з іншого потоку
+        with self._lock:
+            return {key: (histogram.copy(), self.errors[key]) for key, histogram in self.histograms.items()}
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.errors.clear()
+
+    def report(self, family=None):
+        rows = []
+        for (row_family, name), (histogram, errors) in sorted(self.snapshot().items()):
+            if family is None or row_family == family:
+                percentiles = [histogram.percentile(share) / 1e6 for share in QUANTILES]
+                rows.append((row_family, name, histogram.count, errors, *percentiles, histogram.max / 1e6))
+        return rows
+
+    def format_report(self, family=None):
+        rows = self.report(family)
+        if not rows:
+            return "Статистики ще немає."
+        lines = [f"{'Операція':<28}{'Викликів':>10}{'Помилок':>9}{'p50, мс':>11}{'p95, мс':>11}{'p99, мс':>11}{'max, мс':>11}"]
+        for _, name, count, errors, p50, p95, p99, slowest in rows:
+            lines.append(f"{name:<28}{count:>10}{errors:>9}{p50:>11.3f}{p95:>11.3f}{p99:>11.3f}{slowest:>11.3f}")
+        return "\n".join(lines)
+
+    def to_prometheus(self, prefix="contact_book"):
+        by_family = {}
+        for (family, name), value in sorted(self.snapshot().items()):
+            by_family.setdefault(family, []).append((name, *value))
+        lines = []
+        for family, rows in by_family.items():
+            metric = f"{prefix}_{family}_duration_seconds"
+            lines.append(f"# HELP {metric} {FAMILIES.get(family, family)}")
+            lines.append(f"# TYPE {metric} summary")
+            for name, histogram, _ in rows:
+                label = escape_label(name)
+                for share in QUANTILES:
+                    lines.append(f'{metric}{{name="{label}",quantile="{share}"}} {histogram.percentile(share) / 1e9:.9f}')
+                lines.append(f'{metric}_sum{{name="{label}"}} {histogram.total / 1e9:.9f}')
+                lines.append(f'{metric}_count{{name="{label}"}} {histogram.count}')
+            errors = f"{prefix}_{family}_errors_total"
+            lines.append(f"# HELP {errors} Кількість невдалих викликів.")
+            lines.append(f"# TYPE {errors} counter")
+            for name, _, failed in rows:
+                lines.append(f'{errors}{{name="{escape_label(name)}"}} {failed}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, filename):
+        # Запис через тимчасовий файл і перейменування: node exporter ніколи не читає файл наполовину
+        temporary = f"{filename}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(temporary, filename)
+
+
+def escape_label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class PrometheusDumper:
+    # Фоновий потік періодично скидає метрики у файл для textfile-колектора node exporter
+    def __init__(self, metrics, filename, interval=15.0):
+        self.metrics = metrics
+        self.filename = filename
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-dumper", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.dump()
+
+    def dump(self):
+        try:
+            self.metrics.write_prometheus(self.filename)
+        except OSError as e:
+            print(f"Не вдалося записати метрики у {self.filename}: {e}")
+
+    def stop(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.dump()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+metrics = Metrics()
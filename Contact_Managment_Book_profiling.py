@@ -0,0 +1,179 @@
+import collections
+import io
+import os
+import sys
+import threading
+from contextlib import contextmanager
+
+PROFILERS = ("cprofile", "sample")
+MAX_DEPTH = 64
+
+
+def function_label(filename, line, name):
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+class SamplingProfiler:
+    # Раз на interval секунд знімає стеки всіх потоків; накладні витрати не залежать від кількості
+    # викликів, тож він бачить і фонові задачі GUI, яких cProfile з головного потоку не помічає
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.samples = collections.Counter()
+        self.total = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="profiler-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        me = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack = []
+                while frame is not None and len(stack) < MAX_DEPTH:
+                    code = frame.f_code
+                    stack.append(function_label(code.co_filename, code.co_firstlineno, code.co_name))
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)))
+                self.samples[tuple(reversed(stack))] += 1
+            self.total += 1
+
+    def collapsed(self):
+        return [(";".join(stack), count) for stack, count in self.samples.most_common()]
+
+    def report(self, limit=30):
+        own = collections.Counter()
+        inclusive = collections.Counter()
+        for stack, count in self.samples.items():
+            own[stack[-1]] += count
+            for label in set(stack[1:]):
+                inclusive[label] += count
+        total = sum(self.samples.values()) or 1
+        lines = [f"Вибірок: {self.total} (інтервал {self.interval * 1000:.1f} мс), стеків потоків: {total}",
+                 f"{'власний %':>10}{'разом %':>10}  функція"]
+        for label, count in own.most_common(limit):
+            lines.append(f"{count * 100 / total:>10.1f}{inclusive[label] * 100 / total:>10.1f}  {label}")
+        return "\n".join(lines)
+
+
+class CProfiler:
+    # Детермінований профайлер: точні лічильники викликів, але лише для потоку, де його запустили
+    def __init__(self):
+        # cProfile і pstats імпортуються лише для профілювання, щоб не сповільнювати звичайний запуск
+        import cProfile
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+
+    def stats(self, stream=None):
+        import pstats
+        return pstats.Stats(self.profile, stream=stream)
+
+    def report(self, limit=30):
+        out = io.StringIO()
+        stats = self.stats(out)
+        out.write("За власним часом:\n")
+        stats.sort_stats("tottime").print_stats(limit)
+        out.write("\nЗа сукупним часом:\n")
+        stats.sort_stats("cumulative").print_stats(limit)
+        return out.getvalue()
+
+    def collapsed(self):
+        # cProfile зберігає лише пари викликач-викликаний, тож стеки відновлюються розподілом
+        # часу кожної функції між її викликаними пропорційно до їхнього сукупного часу
+        stats = self.stats().stats
+        children = collections.defaultdict(list)
+        for callee, (_, _, _, _, callers) in stats.items():
+            for caller, (_, _, _, cumulative) in callers.items():
+                children[caller].append((callee, cumulative))
+        roots = [func for func, (_, _, _, _, callers) in stats.items() if not callers]
+        lines = collections.Counter()
+
+        def walk(func, path, budget):
+            _, _, own, cumulative, _ = stats[func]
+            label = function_label(*func)
+            path = path + [label]
+            share = budget / cumulative if cumulative else 0
+            if own * share >= 1e-6:
+                lines[";".join(path)] += int(own * share * 1e6)
+            if len(path) >= MAX_DEPTH:
+                return
+            for callee, edge in children.get(func, ()):
+                if function_label(*callee) not in path and edge * share >= 1e-6:
+                    walk(callee, path, edge * share)
+
+        for root in roots:
+            walk(root, [], stats[root][3])
+        return lines.most_common()
+
+
+def make_profiler(kind, interval=0.005):
+    if kind == "sample":
+        return SamplingProfiler(interval)
+    if kind == "cprofile":
+        return CProfiler()
+    raise ValueError(f"Невідомий профайлер '{kind}'. Доступні: {', '.join(PROFILERS)}.")
+
+
+def write_results(profiler, prefix):
+    # prefix.txt - гарячі точки, prefix.folded - стеки для flamegraph.pl і speedscope
+    with open(f"{prefix}.txt", "w", encoding="utf-8") as f:
+        f.write(profiler.report() + "\n")
+    with open(f"{prefix}.folded", "w", encoding="utf-8") as f:
+        for stack, count in profiler.collapsed():
+            f.write(f"{stack} {count}\n")
+    if isinstance(profiler, CProfiler):
+        profiler.profile.dump_stats(f"{prefix}.prof")
+
+
+@contextmanager
+def profiling(kind, prefix="profile", interval=0.005):
+    profiler = make_profiler(kind, interval)
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        write_results(profiler, prefix)
+        print(f"Профіль записано у {prefix}.txt і {prefix}.folded.", file=sys.stderr)
+
+
+class CommandProfiler:
+    # Хук для CommandRegistry.add_hook: cProfile вмикається лише на час виконання команд,
+    # тож очікування введення й сам REPL у профіль не потрапляють
+    def __init__(self):
+        self.profiler = CProfiler()
+        self.commands = collections.Counter()
+
+    @contextmanager
+    def __call__(self, command, session):
+        self.commands[command.name] += 1
+        self.profiler.start()
+        try:
+            yield
+        finally:
+            self.profiler.stop()
+
+    def report(self, limit=30):
+        return self.profiler.report(limit)
+
+
+def add_profile_arguments(parser):
+    parser.add_argument("--profile", choices=PROFILERS, help="профілювати сесію: cprofile (точно, один потік) або sample (вибірки всіх потоків)")
+    parser.add_argument("--profile-output", default="profile", metavar="PREFIX", help="префікс файлів профілю (.txt, .folded, .prof)")
+    parser.add_argument("--profile-interval", type=float, default=0.005, help="інтервал вибірок для sample, у секундах")
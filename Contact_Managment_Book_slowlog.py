@@ -0,0 +1,141 @@
+import collections
+import datetime
+import json
+import re
+import threading
+
+DEFAULT_THRESHOLD = 0.5
+KEEP_RECENT = 200
+
+# Телефони й пошта не потрапляють у журнал. Пошук за уривком номера ("067", "4567") теж розкриває
+# номер, тому маскуються всі цифри будь-якої групи з трьох і більше цифр; від пошти лишається домен
+PHONE_PATTERN = re.compile(r"\+?\d[\d\s()-]*\d")
+PHONE_MIN_DIGITS = 3
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@([\w-]+(?:\.[\w-]+)+)")
+
+
+def redact(value):
+    text = str(value)
+    text = EMAIL_PATTERN.sub(lambda match: f"***@{match.group(1)}", text)
+    return PHONE_PATTERN.sub(mask_digits, text)
+
+
+def mask_digits(match):
+    text = match.group()
+    if sum(char.isdigit() for char in text) < PHONE_MIN_DIGITS:
+        return text
+    return re.sub(r"\d", "*", text)
+
+
+class SlowLog:
+    # Повільні операції: остання сотня записів у пам'яті для команди slowlog і, за потреби,
+    # файл з ротацією, щоб випадок "усе зависло" можна було розібрати вже після нього
+    def __init__(self, threshold=DEFAULT_THRESHOLD, thresholds=None, keep=KEEP_RECENT):
+        self.threshold = threshold
+        self.thresholds = dict(thresholds or {})
+        self.filename = None
+        self.entries = collections.deque(maxlen=keep)
+        self._lock = threading.Lock()
+        self._logger = None
+
+    def configure(self, filename=None, threshold=None, thresholds=None, max_bytes=1024 * 1024, backups=3):
+        if threshold is not None:
+            self.threshold = threshold
+        if thresholds:
+            self.thresholds.update(thresholds)
+        if filename and filename != self.filename:
+            self._open(filename, max_bytes, backups)
+        return self
+
+    def _open(self, filename, max_bytes, backups):
+        # logging підключається лише тоді, коли журнал справді пишеться у файл: це помітна частка часу запуску
+        import logging.handlers
+        logger = logging.getLogger(f"contact_book.slowlog.{filename}")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
+        handler = logging.handlers.RotatingFileHandler(filename, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        # Записи з попередніх сесій теж видно в команді slowlog
+        with self._lock:
+            self.entries.extend(read_entries(filename, self.entries.maxlen))
+            self.filename = filename
+            self._logger = logger
+
+    def threshold_for(self, name):
+        return self.thresholds.get(name, self.threshold)
+
+    def record(self, kind, name, seconds, args=(), book_size=None, results=None):
+        threshold = self.threshold_for(name)
+        if threshold is None or seconds < threshold:
+            return None
+        entry = {
+            "time": datetime.datetime.now().isoformat(timespec="milliseconds"),
+            "kind": kind,
+            "name": name,
+            "seconds": round(seconds, 6),
+            "args": [redact(arg) for arg in args],
+            "book_size": book_size,
+            "results": results,
+        }
+        with self._lock:
+            self.entries.append(entry)
+            if self._logger is not None:
+                self._logger.info(json.dumps(entry, ensure_ascii=False))
+        return entry
+
+    def recent(self, limit=20):
+        with self._lock:
+            return list(self.entries)[-limit:]
+
+
+def read_entries(filename, limit):
+    try:
+        with open(filename, encoding="utf-8") as f:
+            lines = collections.deque(f, maxlen=limit)
+    except OSError:
+        return []
+    entries = []
+    for line in lines:
+        try:
+            entries.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return entries
+
+
+def result_count(value):
+    if isinstance(value, (list, tuple, dict)):
+        return len(value)
+    return None
+
+
+def format_entries(entries):
+    if not entries:
+        return "Повільних операцій не зафіксовано."
+    lines = []
+    for entry in entries:
+        args = " ".join(entry["args"])
+        results = "" if entry["results"] is None else f", результатів: {entry['results']}"
+        lines.append(f"{entry['time']}  {entry['seconds'] * 1000:>9.1f} мс  {entry['kind']}:{entry['name']} {args}".rstrip()
+                     + f"  (контактів: {entry['book_size']}{results})")
+    return "\n".join(lines)
+
+
+def parse_thresholds(values):
+    # "0.2" задає загальний поріг, "birthdays=0.1" - поріг для окремої операції
+    threshold = None
+    thresholds = {}
+    for value in values or ():
+        name, _, seconds = value.rpartition("=")
+        if name:
+            thresholds[name] = float(seconds)
+        else:
+            threshold = float(seconds)
+    return threshold, thresholds
+
+
+slowlog = SlowLog()
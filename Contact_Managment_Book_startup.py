@@ -0,0 +1,152 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from Contact_Managment_Book_core import AddressBook
+from Contact_Managment_Book_generator import write_contacts
+from Contact_Managment_Book_validation import validate_contacts
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PROMPT_MARKER = "Введіть команду".encode("utf-8")
+
+
+def best_wall(command, repeat, env=None):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run(command, cwd=HERE, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def slowest_imports(module, limit=10):
+    # -X importtime друкує для кожного модуля власний і сукупний час у мікросекундах
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=HERE, capture_output=True, text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        own, cumulative, name = [part.strip() for part in line[len("import time:"):].split("|")]
+        if own.isdigit():
+            rows.append((name, int(own) / 1e6, int(cumulative) / 1e6))
+    rows.sort(key=lambda row: row[2], reverse=True)
+    return rows[:limit]
+
+
+def time_to_prompt(filename, fast_start=False, timeout=120):
+    # Час від запуску процесу до підказки REPL: input() скидає буфер виводу саме в цей момент
+    command = [sys.executable, os.path.join(HERE, "Contact_Managment_Book_v2.py"), "--file", filename]
+    if fast_start:
+        command.append("--fast-start")
+    started = time.perf_counter()
+    process = subprocess.Popen(command, cwd=HERE, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    output = b""
+    try:
+        while PROMPT_MARKER not in output:
+            chunk = os.read(process.stdout.fileno(), 65536)
+            if not chunk or time.perf_counter() - started > timeout:
+                raise RuntimeError("REPL не показав підказку.")
+            output += chunk
+        elapsed = time.perf_counter() - started
+        process.stdin.write(b"q\n")
+        process.stdin.flush()
+    finally:
+        process.stdin.close()
+        process.stdout.close()
+        process.wait()
+    return elapsed
+
+
+def in_process_phases(filename, repeat):
+    # Розбір, валідація і створення записів вимірюються в цьому процесі, окремо одне від одного
+    best = {"read": None, "parse": None, "validate": None, "records": None}
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with open(filename, encoding="utf-8") as f:
+            text = f.read()
+        read = time.perf_counter() - started
+        started = time.perf_counter()
+        data = json.loads(text)
+        parse = time.perf_counter() - started
+        started = time.perf_counter()
+        validate_contacts(data)
+        validate = time.perf_counter() - started
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            AddressBook(lazy=True).import_records(data)
+        records = time.perf_counter() - started - validate
+        for phase, value in (("read", read), ("parse", parse), ("validate", validate), ("records", max(records, 0.0))):
+            best[phase] = value if best[phase] is None else min(best[phase], value)
+    return best
+
+
+def measure(filename, repeat=3):
+    interpreter = best_wall([sys.executable, "-c", "pass"], repeat)
+    with_imports = best_wall([sys.executable, "-c", "import Contact_Managment_Book_v2"], repeat)
+    phases = in_process_phases(filename, repeat)
+    prompt = min(time_to_prompt(filename) for _ in range(repeat))
+    fast_prompt = min(time_to_prompt(filename, fast_start=True) for _ in range(repeat))
+    # Фаза "prompt" - залишок до підказки: вивід привітання плюс усе, що не потрапило в попередні виміри
+    # (холодний кеш і збирач сміття в новому процесі)
+    accounted = with_imports + sum(phases.values())
+    with open(filename, encoding="utf-8") as f:
+        contacts = len(json.load(f))
+    return {
+        "file": filename,
+        "contacts": contacts,
+        "phases_s": {
+            "interpreter": round(interpreter, 4),
+            "imports": round(with_imports - interpreter, 4),
+            **{phase: round(value, 4) for phase, value in phases.items()},
+            "prompt": round(max(prompt - accounted, 0.0), 4),
+        },
+        "time_to_prompt_s": round(prompt, 4),
+        "fast_start_time_to_prompt_s": round(fast_prompt, 4),
+        "slowest_imports": [{"module": name, "own_s": own, "cumulative_s": cumulative}
+                            for name, own, cumulative in slowest_imports("Contact_Managment_Book_v2")],
+    }
+
+
+def format_result(result):
+    lines = [f"{result['file']} ({result['contacts']} контактів)"]
+    for phase, value in result["phases_s"].items():
+        lines.append(f"  {phase:<12}{value * 1000:>10.1f} мс")
+    lines.append(f"  {'до підказки':<12}{result['time_to_prompt_s'] * 1000:>10.1f} мс")
+    lines.append(f"  {'--fast-start':<12}{result['fast_start_time_to_prompt_s'] * 1000:>10.1f} мс")
+    lines.append("  Найповільніші імпорти:")
+    for row in result["slowest_imports"]:
+        lines.append(f"    {row['cumulative_s'] * 1000:>8.1f} мс  {row['module']}")
+    return "\n".join(lines)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Бенчмарк часу запуску REPL книги контактів")
+    parser.add_argument("--file", default="contacts_book.json", help="файл книги контактів")
+    parser.add_argument("--generate", type=int, metavar="N", help="замість --file згенерувати книгу з N контактів")
+    parser.add_argument("--repeat", type=int, default=3, help="кількість повторів кожного виміру (береться найкращий)")
+    parser.add_argument("--json", action="store_true", help="вивести результат у форматі JSON")
+    return parser
+
+
+def main(argv=None):
+    options = build_parser().parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="contact-book-startup-") as workdir:
+        filename = os.path.abspath(options.file)
+        if options.generate:
+            filename = os.path.join(workdir, f"contacts_{options.generate}.json")
+            with open(filename, "w", encoding="utf-8") as out:
+                write_contacts(out, options.generate)
+        result = measure(filename, max(options.repeat, 1))
+    print(json.dumps(result, ensure_ascii=False, indent=2) if options.json else format_result(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
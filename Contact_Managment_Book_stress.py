@@ -0,0 +1,146 @@
+import argparse
+import random
+import sys
+import threading
+import time
+
+from Contact_Managment_Book_core import AddressBook, Find, Record
+
+
+def make_phone(number):
+    return f"{number % 10 ** 10:010d}"
+
+
+def seed_book(book, size):
+    # У кожного контакту два однакові телефони: письменники змінюють обидва в одній виключній
+    # секції, тож читач, що бачить різні номери, бачить зміну наполовину
+    for number in range(size):
+        record = Record(f"Stress{number} Contact")
+        record.add_phone(make_phone(number))
+        record.add_phone(make_phone(number))
+        record.add_birthday(f"{number % 28 + 1:02d}.{number % 12 + 1:02d}.1990")
+        book.add_record(record)
+
+
+def check_record(record, errors):
+    phones = [str(phone) for phone in record.phones]
+    if len(phones) != 2 or phones[0] != phones[1]:
+        errors.append(f"{record.original_name}: розірвані телефони {phones}")
+
+
+def writer(book, size, stop, errors, counters, seed):
+    rng = random.Random(seed)
+    while not stop.is_set():
+        number = rng.randrange(size)
+        action = rng.random()
+        if action < 0.6:
+            record = book.find(f"Stress{number} Contact")
+            if record is None:
+                continue
+            phone = make_phone(rng.randrange(10 ** 10))
+            with book.lock.write():
+                record.edit_phone(0, phone)
+                record.edit_phone(1, phone)
+        elif action < 0.8:
+            with book.lock.write():
+                if book.find(f"Stress{number} Contact") is not None:
+                    book.delete(f"Stress{number} Contact")
+        else:
+            record = Record(f"Stress{number} Contact")
+            phone = make_phone(rng.randrange(10 ** 10))
+            record.add_phone(phone)
+            record.add_phone(phone)
+            book.add_record(record)
+        counters["writes"] += 1
+
+
+def reader(book, size, stop, errors, counters, seed):
+    rng = random.Random(seed)
+    while not stop.is_set():
+        action = rng.random()
+        if action < 0.4:
+            with book.lock.read():
+                for record in book.data.values():
+                    check_record(record, errors)
+                if list(book.names) != sorted(book.data):
+                    errors.append("Індекс імен не збігається з книгою.")
+        elif action < 0.7:
+            name = f"Stress{rng.randrange(size)} Contact"
+            for record in Find.find_by_name(book, name):
+                with book.lock.read():
+                    check_record(record, errors)
+        elif action < 0.9:
+            for record in book.search(f"stress{rng.randrange(size)}"):
+                with book.lock.read():
+                    check_record(record, errors)
+        elif action < 0.95:
+            book.upcoming_birthdays(30)
+        else:
+            # Знімок не змінюється, хоч письменники й далі працюють з книгою
+            snapshot = book.snapshot()
+            before = [record.to_dict() for record in snapshot.values()]
+            time.sleep(0.01)
+            for record in snapshot.values():
+                check_record(record, errors)
+            if [record.to_dict() for record in snapshot.values()] != before:
+                errors.append("Знімок книги змінився після створення.")
+        counters["reads"] += 1
+
+
+def run(size=2000, readers=4, writers=2, seconds=5.0, thread_safe=True):
+    book = AddressBook(lazy=True, thread_safe=thread_safe)
+    seed_book(book, size)
+    book.search_index()
+    stop = threading.Event()
+    errors = []
+    counters = {"reads": 0, "writes": 0}
+
+    def guarded(target):
+        # Виняток у потоці (наприклад, зміна словника під час обходу) теж є помилкою
+        def run_thread(*args):
+            try:
+                target(*args)
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}")
+        return run_thread
+
+    threads = [threading.Thread(target=guarded(reader), args=(book, size, stop, errors, counters, seed)) for seed in range(readers)]
+    threads += [threading.Thread(target=guarded(writer), args=(book, size, stop, errors, counters, 1000 + seed)) for seed in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    # Після зупинки письменників індекси мають точно відповідати книзі
+    if list(book.names) != sorted(book.data):
+        errors.append("Індекс імен не збігається з книгою після тесту.")
+    for key, record in book.data.items():
+        check_record(record, errors)
+        if book.search_index().terms.get(key) is None:
+            errors.append(f"{key}: відсутній в індексі пошуку.")
+    return counters, errors
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Стрес-тест паралельних читачів і письменників книги контактів")
+    parser.add_argument("--size", type=int, default=2000, help="кількість контактів")
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--unsafe", action="store_true", help="вимкнути блокування, щоб побачити, що перевірка ловить гонки")
+    return parser
+
+
+def main(argv=None):
+    options = build_parser().parse_args(argv)
+    counters, errors = run(options.size, options.readers, options.writers, options.seconds, not options.unsafe)
+    print(f"Читань: {counters['reads']}, змін: {counters['writes']}, помилок: {len(errors)}")
+    for error in errors[:20]:
+        print(f"  {error}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+class Span:
+    __slots__ = ("tracer", "name", "category", "args", "started")
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.started = 0
+
+    def set(self, **args):
+        self.args.update(args)
+
+    def __enter__(self):
+        self.started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        duration = time.perf_counter_ns() - self.started
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer.add(self.name, self.category, self.started, duration, self.args)
+        return False
+
+
+class NullSpan:
+    # Вимкнене трасування: один спільний об'єкт без жодних вимірів і записів
+    __slots__ = ()
+
+    def set(self, **args):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+class Tracer:
+    # Події у форматі Chrome trace ("X" - завершений відрізок), їх відкривають chrome://tracing і Perfetto.
+    # Вкладеність відрізків видно з часу початку і тривалості в межах одного потоку
+    def __init__(self):
+        self.enabled = False
+        self.events = []
+        self.threads = {}
+        self.origin = time.perf_counter_ns()
+
+    def start(self):
+        self.events = []
+        self.threads = {}
+        self.origin = time.perf_counter_ns()
+        self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+
+    def add(self, name, category, started, duration, args):
+        thread = threading.get_ident()
+        if thread not in self.threads:
+            self.threads[thread] = threading.current_thread().name
+        # list.append атомарний, тож потоки пишуть події без окремого блокування
+        self.events.append({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (started - self.origin) / 1000,
+            "dur": duration / 1000,
+            "pid": os.getpid(),
+            "tid": thread,
+            "args": args,
+        })
+
+    def to_chrome(self):
+        pid = os.getpid()
+        metadata = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": thread, "args": {"name": name}}
+                    for thread, name in list(self.threads.items())]
+        return {"traceEvents": metadata + list(self.events), "displayTimeUnit": "ms"}
+
+    def export(self, filename):
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome(), f, ensure_ascii=False, default=str)
+
+    @contextmanager
+    def recording(self, filename):
+        self.start()
+        try:
+            yield self
+        finally:
+            self.stop()
+            self.export(filename)
+
+
+tracer = Tracer()
+
+
+def span(name, category="book", /, **args):
+    if not tracer.enabled:
+        return NULL_SPAN
+    return Span(tracer, name, category, args)
+
+
+def traced(name, category="query"):
+    # Відрізок на весь виклик функції; для списків результатів додається їх кількість
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return function(*args, **kwargs)
+            with Span(tracer, name, category, {}) as current:
+                result = function(*args, **kwargs)
+                if isinstance(result, list):
+                    current.set(results=len(result))
+                return result
+        return wrapper
+    return decorator
@@ -0,0 +1,196 @@
+import datetime
+import re
+from collections import namedtuple
+
+# Шаблони компілюються один раз на весь процес, а не на кожне значення
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+HASHTAG_PATTERN = re.compile(r"^#\w+$")
+BIRTHDAY_PATTERN = re.compile(r"^(\d{1,2})\.(\d{1,2})\.(\d{4})$")
+
+PHONE_LENGTH = 10
+NOTION_MAX_LENGTH = 280
+ADDRESS_MAX_LENGTH = 120
+
+ValidationIssue = namedtuple("ValidationIssue", ["row", "field", "value", "reason"])
+
+
+def is_valid_phone(value):
+    return isinstance(value, str) and len(value) == PHONE_LENGTH and value.isdigit()
+
+
+def is_valid_email(value):
+    return isinstance(value, str) and EMAIL_PATTERN.match(value) is not None
+
+
+def is_valid_hashtag(value):
+    return isinstance(value, str) and HASHTAG_PATTERN.match(value) is not None
+
+
+def parse_birthday(value):
+    match = BIRTHDAY_PATTERN.match(value) if isinstance(value, str) else None
+    if match is None:
+        return None
+    day, month, year = match.groups()
+    try:
+        return datetime.datetime(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def check_phones(column):
+    return [is_valid_phone(value) for value in column]
+
+
+def check_emails(column):
+    match = EMAIL_PATTERN.match
+    return [isinstance(value, str) and match(value) is not None for value in column]
+
+
+def check_hashtags(column):
+    match = HASHTAG_PATTERN.match
+    return [isinstance(value, str) and match(value) is not None for value in column]
+
+
+def parse_birthdays(column):
+    # Однакові дати у великих файлах повторюються, тому кожну унікальну розбираємо один раз
+    parsed = {}
+    result = []
+    for value in column:
+        if not isinstance(value, str):
+            result.append(None)
+            continue
+        if value not in parsed:
+            parsed[value] = parse_birthday(value)
+        result.append(parsed[value])
+    return result
+
+
+class ValidationReport:
+    def __init__(self):
+        self.rows = []
+        self.errors = []
+
+    def add_error(self, row, field, value, reason):
+        self.errors.append(ValidationIssue(row, field, value, reason))
+
+    def errors_for(self, row):
+        return [issue for issue in self.errors if issue.row == row]
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def __len__(self):
+        return len(self.rows)
+
+    def summary(self):
+        counts = {}
+        for issue in self.errors:
+            counts[issue.field] = counts.get(issue.field, 0) + 1
+        return counts
+
+
+def list_field(report, row_index, field, value):
+    # Поля-списки з файлу: відсутнє значення - порожній список, а рядок чи число - помилка,
+    # інакше рядок телефону розібрався б по одній цифрі
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    report.add_error(row_index, field, value, "Значення має бути списком.")
+    return None
+
+
+def validate_contacts(records_data):
+    report = ValidationReport()
+    rows = []
+
+    # Розгортаємо всі значення в колонки, щоб перевіряти їх одним проходом
+    phone_column, phone_rows = [], []
+    email_column, email_rows = [], []
+    birthday_column, birthday_rows = [], []
+    hashtag_column, hashtag_owners = [], []
+
+    for row_index, record_data in enumerate(records_data):
+        if not isinstance(record_data, dict):
+            report.add_error(row_index, "record", record_data, "Запис має бути об'єктом JSON.")
+            rows.append(None)
+            continue
+
+        name = record_data.get("name")
+        name_parts = name.split() if isinstance(name, str) else []
+        if not 1 <= len(name_parts) <= 2:
+            report.add_error(row_index, "name", name, "Ім'я має містити одне або два слова.")
+            rows.append(None)
+            continue
+
+        row = {"name": name, "phones": [], "email": None, "birthday": None, "notions": [], "address": None}
+        rows.append(row)
+
+        for phone in list_field(report, row_index, "phone", record_data.get("phones")) or []:
+            phone_column.append(phone)
+            phone_rows.append(row_index)
+
+        email = record_data.get("email")
+        if email:
+            email_column.append(email)
+            email_rows.append(row_index)
+
+        birthday = record_data.get("birthday")
+        if birthday:
+            birthday_column.append(birthday)
+            birthday_rows.append(row_index)
+
+        for notion_data in list_field(report, row_index, "notion", record_data.get("notions")) or []:
+            text = notion_data.get("text") if isinstance(notion_data, dict) else None
+            if not text or not isinstance(text, str) or len(text) > NOTION_MAX_LENGTH:
+                report.add_error(row_index, "notion", text, "Текст нотатки не може бути порожнім або перевищувати 280 символів.")
+                continue
+            hashtags = list_field(report, row_index, "hashtag", notion_data.get("hashtags"))
+            if hashtags is None:
+                # Як і з неправильним хештегом, нотатка відкидається цілком
+                continue
+            notion = {"text": text, "hashtags": list(hashtags)}
+            row["notions"].append(notion)
+            for hashtag in notion["hashtags"]:
+                hashtag_column.append(hashtag)
+                hashtag_owners.append((row_index, notion))
+
+        for address in list_field(report, row_index, "address", record_data.get("addresses")) or []:
+            if isinstance(address, str) and len(address) <= ADDRESS_MAX_LENGTH:
+                row["address"] = address
+            else:
+                report.add_error(row_index, "address", address, "Адреса перевищує максимально допустиму довжину в 120 символів.")
+
+    for row_index, phone, valid in zip(phone_rows, phone_column, check_phones(phone_column)):
+        if valid:
+            rows[row_index]["phones"].append(phone)
+        else:
+            report.add_error(row_index, "phone", phone, "Номер повинен містити 10 цифр.")
+
+    for row_index, email, valid in zip(email_rows, email_column, check_emails(email_column)):
+        if valid:
+            rows[row_index]["email"] = email
+        else:
+            report.add_error(row_index, "email", email, "Неіснуючий формат адреси електронної пошти.")
+
+    for row_index, birthday, parsed in zip(birthday_rows, birthday_column, parse_birthdays(birthday_column)):
+        if parsed is not None:
+            rows[row_index]["birthday"] = parsed
+        else:
+            report.add_error(row_index, "birthday", birthday, "Використовуйте формат ДД.ММ.РРРР.")
+
+    # Нотатка з хоча б одним неправильним хештегом відкидається цілком, як і в Notion
+    rejected_notions = set()
+    for (row_index, notion), hashtag, valid in zip(hashtag_owners, hashtag_column, check_hashtags(hashtag_column)):
+        if not valid:
+            report.add_error(row_index, "hashtag", hashtag, "Неправильний формат хештегу.")
+            rejected_notions.add(id(notion))
+    if rejected_notions:
+        for row in rows:
+            if row is not None:
+                row["notions"] = [notion for notion in row["notions"] if id(notion) not in rejected_notions]
+
+    report.errors.sort(key=lambda issue: issue.row)
+    report.rows = [row for row in rows if row is not None]
+    return report
@@ -0,0 +1,95 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class Cancelled(Exception):
+    pass
+
+
+class Task:
+    def __init__(self, name):
+        self.name = name
+        self.progress = None
+        self.future = None
+        self.messages = queue.SimpleQueue()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def report(self, done, total):
+        # Викликається з робочого потоку; скасування спрацьовує на найближчому звіті про прогрес
+        if self._cancel_event.is_set():
+            raise Cancelled(self.name)
+        self.progress = (done, total)
+
+    def post(self, message):
+        # Проміжний вивід задачі, який потік Tk забирає під час наступного опитування
+        if self._cancel_event.is_set():
+            raise Cancelled(self.name)
+        self.messages.put(message)
+
+
+class TaskRunner:
+    def __init__(self, widget, poll_interval=50, max_workers=1):
+        self.widget = widget
+        self.poll_interval = poll_interval
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="book-worker")
+        self.active = set()
+
+    def submit(self, name, function, on_done=None, on_error=None, on_progress=None, on_cancel=None, on_message=None):
+        # function(task) виконується у робочому потоці, а всі колбеки повертаються в потік Tk через after()
+        task = Task(name)
+        task.future = self.executor.submit(function, task)
+        self.active.add(task)
+        callbacks = {"done": on_done, "error": on_error, "progress": on_progress, "cancel": on_cancel, "message": on_message}
+        self.widget.after(self.poll_interval, self._poll, task, callbacks)
+        return task
+
+    def _poll(self, task, callbacks):
+        # Стан перевіряється до розбору черги, щоб не загубити повідомлення, надіслані наприкінці
+        finished = task.future.done()
+        if callbacks["progress"] is not None and task.progress is not None:
+            callbacks["progress"](*task.progress)
+        while not task.messages.empty():
+            message = task.messages.get_nowait()
+            if callbacks["message"] is not None and not task.cancelled:
+                callbacks["message"](message)
+        if not finished:
+            self.widget.after(self.poll_interval, self._poll, task, callbacks)
+            return
+
+        self.active.discard(task)
+        try:
+            result = task.future.result()
+        except Cancelled:
+            if callbacks["cancel"] is not None:
+                callbacks["cancel"]()
+        except Exception as e:
+            if callbacks["error"] is not None:
+                callbacks["error"](e)
+            else:
+                raise
+        else:
+            if task.cancelled:
+                if callbacks["cancel"] is not None:
+                    callbacks["cancel"]()
+            elif callbacks["done"] is not None:
+                callbacks["done"](result)
+
+    def cancel_all(self):
+        for task in list(self.active):
+            task.cancel()
+
+    @property
+    def busy(self):
+        return bool(self.active)
+
+    def shutdown(self):
+        self.cancel_all()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,73 @@
+import asyncio
+import contextlib
+import http.client
+import io
+import json
+import re
+import threading
+
+import pytest
+
+import Contact_Managment_Book_api as api
+from Contact_Managment_Book_core import AddressBook
+from Contact_Managment_Book_v2 import registry
+
+
+@pytest.fixture
+def server(tmp_path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        book = AddressBook(str(tmp_path / "book.json"), thread_safe=True)
+    server = api.ApiServer(book, registry, port=0, autosave=0)
+    ready = threading.Event()
+    state = {}
+
+    async def run():
+        state["loop"] = asyncio.get_running_loop()
+        task = asyncio.create_task(server.serve())
+        while server.stopping is None or server.port == 0:
+            await asyncio.sleep(0.01)
+        ready.set()
+        await task
+
+    thread = threading.Thread(target=asyncio.run, args=(run(),), daemon=True)
+    thread.start()
+    assert ready.wait(5)
+    yield server
+    state["loop"].call_soon_threadsafe(server.stopping.set)
+    thread.join(5)
+
+
+def request(connection, method, path, body=None):
+    connection.request(method, path, body=None if body is None else json.dumps(body))
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+@pytest.mark.parametrize("body", [
+    {"name": "Ivan", "phones": 123},
+    {"name": "Ivan", "phones": "0501234567"},
+    {"name": "Ivan", "notions": [{"text": "note", "hashtags": "#tag"}]},
+])
+def test_malformed_body_gets_json_error(server, body):
+    connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=5)
+    status, payload = request(connection, "POST", "/contacts", body)
+    assert status == 422
+    assert payload["error"]
+    # З'єднання лишається відкритим для наступних запитів
+    status, payload = request(connection, "GET", "/health")
+    assert status == 200 and payload["records"] == 0
+    connection.close()
+
+
+def test_handler_failure_returns_500(server, monkeypatch, capsys):
+    def broken(request):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(server, "routes", [("GET", re.compile(r"/broken"), broken)] + server.routes)
+    connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=5)
+    status, payload = request(connection, "GET", "/broken")
+    assert status == 500
+    assert payload == {"error": "Внутрішня помилка сервера."}
+    status, _ = request(connection, "GET", "/health")
+    assert status == 200
+    connection.close()
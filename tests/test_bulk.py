@@ -0,0 +1,54 @@
+import contextlib
+import io
+
+from Contact_Managment_Book_core import AddressBook, Record
+
+
+def empty_book(tmp_path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return AddressBook(str(tmp_path / "book.json"))
+
+
+def phones(book, name):
+    return [str(phone) for phone in book.find(name).phones]
+
+
+def test_add_records_replaces_existing_record(tmp_path):
+    book = empty_book(tmp_path)
+    book.add_records([{"name": "Ivan", "phones": ["0501234567"]}, {"name": "Petro"}])
+    replacement = Record("Ivan")
+    replacement.add_phone("0670000000")
+    report = book.add_records([replacement, {"name": "petro", "email": "petro@example.com"}])
+    assert report.ok
+    assert len(book) == 2
+    assert phones(book, "Ivan") == ["0670000000"]
+    assert book.find("Petro").email.value == "petro@example.com"
+    assert [record.name.value for record in book.search("0670")] == ["Ivan"]
+
+
+def test_update_many_keeps_patches_aligned_with_rows(tmp_path):
+    book = empty_book(tmp_path)
+    book.add_records([{"name": "Ivan", "phones": ["0501234567"]}, {"name": "Petro", "phones": ["0671234567"]}])
+    report = book.update_many([
+        {"name": "Anna Maria Koval"},
+        {"name": "Ivan", "phones": ["12345"], "email": "ivan@example.com"},
+        {"name": "Petro", "email": "petro@example.com"},
+        {"name": "Olena", "email": "olena@example.com"},
+        {"name": "Ivan", "birthday": "01.01.1990"},
+    ])
+    assert [(issue.row, issue.field) for issue in report.errors] == [(0, "name"), (1, "phone"), (3, "name")]
+    # Відхилена латка для Ivan не потрапляє в рядки, а наступна латка для нього застосовується
+    assert [row["name"] for row in report.rows] == ["Petro", "Ivan"]
+    assert book.find("Ivan").email is None
+    assert phones(book, "Ivan") == ["0501234567"]
+    assert book.find("Ivan").birthday is not None
+    assert book.find("Petro").email.value == "petro@example.com"
+    assert phones(book, "Petro") == ["0671234567"]
+
+
+def test_delete_many_returns_only_removed_keys(tmp_path):
+    book = empty_book(tmp_path)
+    book.add_records([{"name": "Ivan"}, {"name": "Petro"}])
+    assert book.delete_many(["IVAN", "Olena", "petro", "Ivan"]) == ["ivan", "petro"]
+    assert len(book) == 0
+    assert book.search("Ivan") == []
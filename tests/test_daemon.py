@@ -0,0 +1,68 @@
+import asyncio
+import contextlib
+import io
+import threading
+
+import pytest
+
+import Contact_Managment_Book_client as client
+import Contact_Managment_Book_daemon as daemon
+from Contact_Managment_Book_core import AddressBook
+from Contact_Managment_Book_v2 import registry
+
+
+@pytest.fixture
+def server(tmp_path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        book = AddressBook(str(tmp_path / "book.json"), thread_safe=True)
+    server = daemon.BookServer(book, registry, str(tmp_path / "book.sock"), autosave=0)
+    ready = threading.Event()
+    state = {}
+
+    async def run():
+        state["loop"] = asyncio.get_running_loop()
+        task = asyncio.create_task(server.serve())
+        while server.stopping is None or not (tmp_path / "book.sock").exists():
+            await asyncio.sleep(0.01)
+        ready.set()
+        await task
+
+    thread = threading.Thread(target=asyncio.run, args=(run(),), daemon=True)
+    thread.start()
+    assert ready.wait(5)
+    yield server
+    state["loop"].call_soon_threadsafe(server.stopping.set)
+    thread.join(5)
+
+
+def test_unexpected_error_keeps_connection(server, monkeypatch, capsys):
+    def broken_search(query, limit=50):
+        raise RuntimeError("зламаний індекс")
+
+    monkeypatch.setattr(server.book, "search", broken_search)
+    with client.BookClient(server.path, timeout=5) as connection:
+        response = connection.search("Ivan")
+        assert response["ok"] is False
+        assert "зламаний індекс" in response["error"]
+        # Те саме з'єднання обслуговує наступні запити
+        response = connection.ping()
+        assert response["ok"] is True and response["requests"] == 2
+    assert "RuntimeError" in capsys.readouterr().err
+
+
+def test_malformed_request_keeps_connection(server):
+    with client.BookClient(server.path, timeout=5) as connection:
+        response = connection.request({"op": "run"})
+        assert response["ok"] is False and "Неправильний запит" in response["error"]
+        assert connection.ping()["ok"] is True
+
+
+def test_client_reports_dropped_connection(monkeypatch, capsys):
+    def dropped(self, message):
+        raise ConnectionError("Демон закрив з'єднання.")
+
+    monkeypatch.setattr(client.BookClient, "__init__", lambda self, path: None)
+    monkeypatch.setattr(client.BookClient, "close", lambda self: None)
+    monkeypatch.setattr(client.BookClient, "request", dropped)
+    assert client.main(["--ping"]) == 1
+    assert "Демон закрив з'єднання" in capsys.readouterr().err
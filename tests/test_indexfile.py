@@ -0,0 +1,59 @@
+import contextlib
+import io
+import json
+
+from Contact_Managment_Book_core import AddressBook, Record
+from Contact_Managment_Book_indexfile import index_path, read_header, read_index_file
+
+
+def record(name, phone):
+    result = Record(name)
+    result.add_phone(phone)
+    return result
+
+
+def open_book(filename):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return AddressBook(str(filename))
+
+
+def saved_book(tmp_path):
+    book = open_book(tmp_path / "book.json")
+    book.add_record(record("Ivan", "0501234567"))
+    book.add_record(record("Petro", "0677654321"))
+    book.save_to_json(book.filename)
+    return book
+
+
+def header(filename):
+    with open(index_path(filename), "rb") as f:
+        return read_header(f.read())[0]
+
+
+def test_names_saved_before_search_index_exists(tmp_path):
+    book = saved_book(tmp_path)
+    assert list(header(book.filename)["sections"]) == ["names"]
+    assert len(read_index_file(*book.stamp, "names")) == 2
+    assert read_index_file(*book.stamp, "search") is None
+    # Перший пошук будує індекс і дописує його до файлу
+    assert [record.name.value for record in book.search("0677")] == ["Petro"]
+    assert list(header(book.filename)["sections"]) == ["names", "search"]
+
+
+def test_corrupt_section_falls_back_to_rebuild(tmp_path):
+    book = saved_book(tmp_path)
+    book.search("Ivan")
+    path = index_path(book.filename)
+    with open(path, "rb") as f:
+        raw = bytearray(f.read())
+    # Розділи лежать після заголовка: псуємо їх, не чіпаючи заголовок з відбитком
+    body = len(raw) - sum(size for _, size in header(book.filename)["sections"].values())
+    raw[body:] = b"\xff" * (len(raw) - body)
+    with open(path, "wb") as f:
+        f.write(raw)
+    assert read_index_file(*book.stamp, "names") is None
+    reopened = open_book(book.filename)
+    assert sorted(record.name.value for record in reopened.search("050")) == ["Ivan"]
+    assert len(reopened) == 2
+    with open(book.filename, encoding="utf-8") as f:
+        assert len(json.load(f)) == 2
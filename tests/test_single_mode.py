@@ -0,0 +1,65 @@
+import csv
+import json
+
+import Contact_Managment_Book_v2 as v2
+
+CONTACTS = [
+    {
+        "name": "Lady Gaga",
+        "phones": ["1112223333"],
+        "email": "ladygaga@gmail.com",
+        "birthday": "28.03.1986",
+        "notions": [{"text": "Exciting adventure", "hashtags": ["#travel", "#music"]}],
+        "addresses": ["Los Angeles, CA"],
+    },
+    {
+        "name": "Quentin Tarantino",
+        "phones": ["4445556666"],
+        "email": None,
+        "birthday": None,
+        "notions": [],
+        "addresses": [],
+    },
+]
+
+
+def write_book(tmp_path):
+    book = tmp_path / "book.json"
+    book.write_text(json.dumps(CONTACTS, ensure_ascii=False), encoding="utf-8")
+    return book
+
+
+def test_save_writes_book_to_target(tmp_path):
+    book = write_book(tmp_path)
+    target = tmp_path / "backup.json"
+    assert v2.main(["--file", str(book), "save", str(target)]) == 0
+    assert json.loads(target.read_text(encoding="utf-8")) == CONTACTS
+    assert json.loads(book.read_text(encoding="utf-8")) == CONTACTS
+
+
+def test_export_writes_all_contacts(tmp_path):
+    book = write_book(tmp_path)
+    target = tmp_path / "contacts.csv"
+    assert v2.main(["--file", str(book), "export", str(target)]) == 0
+    with open(target, encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["name", "phones", "email", "birthday", "notions", "address"]
+    assert [row[0] for row in rows[1:]] == ["Lady Gaga", "Quentin Tarantino"]
+    assert rows[1][1] == "1112223333"
+
+
+def test_rejected_phone_fails_without_saving(tmp_path, capsys):
+    book = write_book(tmp_path)
+    before = book.read_text(encoding="utf-8")
+    assert v2.main(["--file", str(book), "add", "New Guy", "abc"]) == 1
+    result = json.loads(capsys.readouterr().out)
+    assert result["ok"] is False
+    assert "saved" not in result
+    assert book.read_text(encoding="utf-8") == before
+
+
+def test_rejected_phone_edit_keeps_old_number(tmp_path, capsys):
+    book = write_book(tmp_path)
+    assert v2.main(["--file", str(book), "edit-phone", "Lady Gaga", "0", "abc"]) == 1
+    assert json.loads(capsys.readouterr().out)["ok"] is False
+    assert json.loads(book.read_text(encoding="utf-8"))[0]["phones"] == ["1112223333"]
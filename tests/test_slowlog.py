@@ -0,0 +1,27 @@
+import pytest
+
+from Contact_Managment_Book_slowlog import SlowLog, redact
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("+380501234567", "+************"),
+    ("(050) 123-45-67", "(***) ***-**-**"),
+    ("067", "***"),
+    ("4567", "****"),
+    ("Ivan 050", "Ivan ***"),
+    ("ivan.petrenko@example.com", "***@example.com"),
+])
+def test_redact_masks_phone_fragments(value, expected):
+    assert redact(value) == expected
+
+
+@pytest.mark.parametrize("value", ["Ivan", "#work", "12", "Room 7"])
+def test_redact_keeps_text_without_digit_runs(value):
+    assert redact(value) == value
+
+
+def test_recorded_search_args_are_redacted():
+    log = SlowLog(threshold=0)
+    entry = log.record("search", "search", 1.0, ("050 12",), 10, 1)
+    assert entry["args"] == ["*** **"]
+    assert "050" not in str(log.recent())
@@ -0,0 +1,50 @@
+import pytest
+
+from Contact_Managment_Book_validation import validate_contacts
+
+
+def issues(report):
+    return [(issue.row, issue.field, issue.value) for issue in report.errors]
+
+
+def test_rejected_values_reported_with_row_and_field():
+    report = validate_contacts([
+        {"name": "Ivan", "phones": ["0501234567", "12345"], "email": "ivan@example.com"},
+        {"name": "Petro", "email": "not-an-email", "birthday": "31.02.2000"},
+        {"name": "Anna Maria Koval"},
+        "Olena",
+    ])
+    assert issues(report) == [
+        (0, "phone", "12345"),
+        (1, "email", "not-an-email"),
+        (1, "birthday", "31.02.2000"),
+        (2, "name", "Anna Maria Koval"),
+        (3, "record", "Olena"),
+    ]
+    assert [row["name"] for row in report.rows] == ["Ivan", "Petro"]
+    # Правильні значення рядка з помилкою лишаються
+    assert report.rows[0]["phones"] == ["0501234567"]
+    assert report.rows[0]["email"] == "ivan@example.com"
+    assert report.summary() == {"phone": 1, "email": 1, "birthday": 1, "name": 1, "record": 1}
+
+
+@pytest.mark.parametrize("field, key, value", [
+    ("phone", "phones", "0501234567"),
+    ("phone", "phones", 501234567),
+    ("notion", "notions", "note"),
+    ("address", "addresses", "Kyiv"),
+])
+def test_non_list_field_is_rejected(field, key, value):
+    report = validate_contacts([{"name": "Ivan", key: value}])
+    assert issues(report) == [(0, field, value)]
+    assert report.rows[0]["phones"] == [] and report.rows[0]["notions"] == []
+
+
+def test_notion_with_bad_hashtags_is_dropped():
+    report = validate_contacts([{"name": "Ivan", "notions": [
+        {"text": "good", "hashtags": ["#work"]},
+        {"text": "bad tag", "hashtags": ["work"]},
+        {"text": "not a list", "hashtags": "#work"},
+    ]}])
+    assert issues(report) == [(0, "hashtag", "#work"), (0, "hashtag", "work")]
+    assert report.rows[0]["notions"] == [{"text": "good", "hashtags": ["#work"]}]